@@ -12,6 +12,7 @@ Features:
 - Multiple market types (Equity, SME, Debt, MF, etc.)
 - Incremental updates
 - Error recovery
+- Reads NSE's JSON API directly where available (browser only for cookies)
 
 Usage:
     python announcements_monitor.py
@@ -21,27 +22,132 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+from chromedriver_cache import get_chromedriver_path
+from log_config import configure_logging
 from selenium.webdriver.chrome.service import Service
-import json
+import orjson
+import hashlib
 import time
 from datetime import datetime
 import logging
 import os
-import schedule
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('announcements_monitor.log'),
-        logging.StreamHandler()
-    ]
-)
+configure_logging('announcements_monitor.log')
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# JSON endpoint the announcements page renders its table from
+NSE_API_URL = 'https://www.nseindia.com/api/corporate-announcements'
+
+# 'index' parameter of the JSON endpoint per market tab. Markets missing
+# here are scraped from the rendered table instead.
+MARKET_API_INDEX = {
+    'Equity': 'equities',
+    'SME': 'sme',
+    'Debt': 'debt',
+    'MF': 'mf',
+    'REIT/InvIT': 'invitsreits',
+}
+
+# Column names used for records fetched from the JSON endpoint; these match
+# the headers of the rendered table
+API_HEADERS = ['SYMBOL', 'COMPANY NAME', 'SUBJECT', 'DETAILS', 'ATTACHMENT', 'XBRL', 'BROADCAST DATE/TIME']
+
+# While scrapes keep returning unchanged data the interval doubles, at most
+# IDLE_BACKOFF_STEPS times and never beyond MAX_INTERVAL_MINUTES
+IDLE_BACKOFF_STEPS = 3
+MAX_INTERVAL_MINUTES = 30
+
+# A scrape is abandoned this long before the next one is due (but is always
+# given at least MIN_SCRAPE_TIMEOUT_SECONDS)
+SCRAPE_TIMEOUT_MARGIN_SECONDS = 30
+MIN_SCRAPE_TIMEOUT_SECONDS = 60
+
+# Consecutive WebDriver errors tolerated before the browser is restarted
+MAX_DRIVER_FAILURES = 3
+
+# Resources the table scrape never needs; blocked via CDP so page loads only
+# fetch the HTML and the scripts that render the table.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp',
+    '*.woff', '*.woff2', '*.ttf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+# Text of the first body row; used to tell when a tab switch or page change
+# has actually re-rendered the table.
+FIRST_ROW_TEXT_JS = """
+const row = document.querySelector('table tbody tr');
+return row ? row.textContent : null;
+"""
+
+# Clicks the Next button if it is enabled, found with querySelectorAll rather
+# than an XPath text() scan. Returns false when there is no next page,
+# otherwise the first row's text from before the click, in the same call.
+CLICK_NEXT_JS = """
+const next = Array.from(document.querySelectorAll('button'))
+    .find(button => button.textContent.includes('Next'));
+if (!next || next.disabled || next.className.includes('disabled')) {
+    return false;
+}
+const row = document.querySelector('table tbody tr');
+const firstRow = row ? row.textContent : null;
+next.click();
+return {firstRow: firstRow};
+"""
+
+# Reads headers, every row and the Next button state of the current table
+# page in a single browser round-trip instead of one WebDriver command per
+# cell. Written as an expression (not a function body) so it can go
+# straight to CDP Runtime.evaluate.
+TABLE_SNAPSHOT_JS = """
+(() => {
+const headers = Array.from(document.querySelectorAll('table thead th'))
+    .map(th => th.innerText.trim())
+    .filter(text => text);
+const rows = Array.from(document.querySelectorAll('table tbody tr'))
+    .map(tr => Array.from(tr.querySelectorAll('td')).map(td => {
+        const text = td.innerText.trim();
+        const link = td.querySelector('a');
+        return link && link.href ? {text: text, link: link.href} : text;
+    }))
+    .filter(cells => cells.length);
+const next = Array.from(document.querySelectorAll('button'))
+    .find(button => button.textContent.includes('Next'));
+const hasNext = !!next && !next.disabled && !next.className.includes('disabled');
+return {headers: headers, rows: rows, hasNext: hasNext};
+})()
+"""
+
+
+def link_type(href):
+    """Classify an announcement link as 'pdf', 'xbrl' or plain 'link'"""
+    href = href.lower()
+    if '.pdf' in href:
+        return 'pdf'
+    if 'xbrl' in href:
+        return 'xbrl'
+    return 'link'
+
+
+def write_json_atomic(filepath, obj, option=None):
+    """Write obj as JSON through a temp file so readers never see a partial file"""
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=option))
+        # Make the bytes durable before the rename, so a crash can't leave
+        # an empty file behind the new name
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
 
 class AnnouncementsMonitor:
     """Monitor NSE Corporate Announcements page and scrape data every 5 minutes"""
@@ -59,8 +165,16 @@ class AnnouncementsMonitor:
         self.url = "https://www.nseindia.com/companies-listing/corporate-filings-announcements"
         self.market_type = market_type
         self.driver = None
+        self.session = None
+        self._cookies_valid = False
         self.headless = headless
         self.last_data = None
+        self._last_hash = None
+        self._stop = threading.Event()
+        self._idle_ticks = 0
+        # Scrapes run here so a hung browser can't block the monitor loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._driver_failures = 0
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
@@ -87,17 +201,30 @@ class AnnouncementsMonitor:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            options.add_argument(f'--user-agent={USER_AGENT}')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Skip images and don't wait for subresources; the table is
+            # waited for explicitly once the DOM is ready
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+            options.page_load_strategy = 'eager'
+            
+            service = Service(get_chromedriver_path())
+            # Reuse one HTTP connection to chromedriver for every command
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.wait = WebDriverWait(self.driver, 20)
             
             # Hide webdriver property
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            self.driver.execute_cdp_cmd('Page.setAdBlockingEnabled', {'enabled': True})
+            
             logger.info("WebDriver initialized successfully")
             return True
             
@@ -106,12 +233,11 @@ class AnnouncementsMonitor:
             return False
     
     def _wait_for_table(self):
-        """Wait for table to be present on page"""
+        """Wait for table rows to be present on page"""
         try:
             table = self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
             )
-            time.sleep(2)  # Additional wait for data to populate
             return True
         except TimeoutException:
             logger.error("Timeout waiting for table to load")
@@ -124,103 +250,211 @@ class AnnouncementsMonitor:
         
         try:
             # Try to click the market type tab
-            tab = self.driver.find_element(By.XPATH, f"//a[text()='{self.market_type}']")
+            tab = self.wait.until(
+                EC.element_to_be_clickable((By.XPATH, f"//a[text()='{self.market_type}']"))
+            )
+            # Let the default tab render first so its rows aren't mistaken
+            # for the new tab's content
+            self._wait_for_table()
+            old_first_row = self._first_row_text()
             tab.click()
-            time.sleep(3)  # Wait for content to load
+            self._wait_for_table_change(old_first_row)
             logger.info(f"Switched to {self.market_type} tab")
             return True
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException):
             logger.warning(f"Could not find {self.market_type} tab, using current tab")
             return False
     
-    def _extract_table_headers(self):
-        """Extract table headers"""
+    def _first_row_text(self):
+        """Text of the first table row, or None if no rows are rendered yet"""
         try:
-            headers = self.driver.find_elements(By.CSS_SELECTOR, "table thead th")
-            return [h.text.strip() for h in headers if h.text.strip()]
-        except Exception as e:
-            logger.error(f"Error extracting headers: {e}")
-            return []
+            return self.driver.execute_script(FIRST_ROW_TEXT_JS)
+        except Exception:
+            return None
     
-    def _extract_table_data(self):
-        """Extract all data from current page"""
+    def _wait_for_table_change(self, old_first_row):
+        """Wait until the table shows rows different from old_first_row"""
         try:
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            data = []
-            
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if cells:
-                    row_data = []
-                    for cell in cells:
-                        # Get text content
-                        text = cell.text.strip()
-                        
-                        # Try to get link if exists (for symbols, attachments, etc.)
-                        try:
-                            link = cell.find_element(By.TAG_NAME, "a")
-                            href = link.get_attribute('href')
-                            if href:
-                                # Check if it's a PDF or XBRL
-                                if '.pdf' in href.lower():
-                                    text = {
-                                        'text': text,
-                                        'link': href,
-                                        'type': 'pdf'
-                                    }
-                                elif 'xbrl' in href.lower():
-                                    text = {
-                                        'text': text,
-                                        'link': href,
-                                        'type': 'xbrl'
-                                    }
-                                else:
-                                    text = {
-                                        'text': text,
-                                        'link': href,
-                                        'type': 'link'
-                                    }
-                        except NoSuchElementException:
-                            pass
-                        
-                        row_data.append(text)
-                    
-                    if row_data:
-                        data.append(row_data)
-            
-            return data
+            self.wait.until(lambda d: self._first_row_text() not in (None, old_first_row))
+            return True
+        except TimeoutException:
+            logger.warning("Timeout waiting for table content to change")
+            return False
+    
+    def _snapshot_table(self):
+        """Read table headers and rows in one CDP Runtime.evaluate call
+        
+        Going through CDP directly skips the WebDriver execute_script layer,
+        which matters for the large value a full page of rows returns.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': TABLE_SNAPSHOT_JS,
+                'returnByValue': True
+            })
+            if 'exceptionDetails' in result:
+                raise RuntimeError(result['exceptionDetails'].get('text', 'script error'))
+            return result['result'].get('value') or {'headers': [], 'rows': []}
         except Exception as e:
-            logger.error(f"Error extracting table data: {e}")
-            return []
+            logger.error(f"Error reading table snapshot: {e}")
+            return {'headers': [], 'rows': []}
+    
+    def _extract_table_headers(self, snapshot=None):
+        """Extract table headers"""
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        return snapshot.get('headers') or []
+    
+    def _extract_table_data(self, snapshot=None):
+        """Extract all data from current page"""
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        
+        data = []
+        for row in snapshot.get('rows') or []:
+            row_data = []
+            for cell in row:
+                # Links (symbols, attachments, etc.) come back as {text, link};
+                # tag them as PDF, XBRL or plain link
+                if isinstance(cell, dict):
+                    cell['type'] = link_type(cell['link'])
+                row_data.append(cell)
+            data.append(row_data)
+        
+        return data
     
-    def _has_next_page(self):
+    def _has_next_page(self, snapshot=None):
         """Check if there's a next page available"""
-        try:
-            next_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[contains(text(), 'Next')]"
-            )
-            return next_button.is_enabled() and 'disabled' not in next_button.get_attribute('class')
-        except NoSuchElementException:
-            return False
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        return bool(snapshot.get('hasNext'))
     
     def _click_next_page(self):
         """Click next page button"""
         try:
-            next_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[contains(text(), 'Next')]"
-            )
-            
-            if next_button.is_enabled() and 'disabled' not in next_button.get_attribute('class'):
-                next_button.click()
-                time.sleep(3)  # Wait for page to load
-                return True
-            return False
+            clicked = self.driver.execute_script(CLICK_NEXT_JS)
+            if not clicked:
+                return False
+            return self._wait_for_table_change(clicked['firstRow'])
         except Exception as e:
             logger.error(f"Error clicking next page: {e}")
             return False
     
+    def _warm_session(self):
+        """Visit the page in the browser and copy its cookies into a requests session
+        
+        NSE only answers API calls that carry the cookies its page sets, so
+        the browser is needed once per session rather than once per page.
+        The requests session itself lives as long as the monitor; a refresh
+        only swaps its cookies, so pooled connections to NSE stay open.
+        """
+        if not self.driver:
+            if not self._init_driver():
+                return False
+        
+        logger.info("Refreshing NSE API session cookies...")
+        self.driver.get(self.url)
+        if not self._wait_for_table():
+            return False
+        
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Referer': self.url,
+                'Accept': 'application/json'
+            })
+        
+        self.session.cookies.clear()
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        self._cookies_valid = True
+        return True
+    
+    def _api_record(self, item):
+        """Convert one JSON API entry to a record shaped like a table row"""
+        attachment = item.get('attchmntFile') or ''
+        if attachment:
+            attachment = {
+                'text': os.path.basename(attachment),
+                'link': attachment,
+                'type': link_type(attachment)
+            }
+        return {
+            'SYMBOL': item.get('symbol', ''),
+            'COMPANY NAME': item.get('sm_name', ''),
+            'SUBJECT': item.get('desc', ''),
+            'DETAILS': item.get('attchmntText', ''),
+            'ATTACHMENT': attachment,
+            'XBRL': '',
+            'BROADCAST DATE/TIME': item.get('an_dt', '')
+        }
+    
+    def fetch_from_api(self):
+        """
+        Fetch all announcements from NSE's JSON API in one request
+        
+        The endpoint is not paginated: one response holds every record, so
+        there are no further pages to fetch concurrently.
+        
+        Returns:
+            dict: Data with metadata, or None if the API can't be used
+                  (the caller then falls back to scraping the table)
+        """
+        index = MARKET_API_INDEX.get(self.market_type)
+        if index is None:
+            return None
+        
+        for attempt in range(2):
+            if not self._cookies_valid:
+                if not self._warm_session():
+                    return None
+            
+            try:
+                response = self.session.get(NSE_API_URL, params={'index': index}, timeout=30)
+            except requests.RequestException as e:
+                logger.warning(f"NSE API request failed: {e}")
+                return None
+            
+            # Expired cookies: harvest a fresh set once, then give up
+            if response.status_code in (401, 403):
+                logger.info(f"NSE API returned {response.status_code}, refreshing cookies")
+                self._cookies_valid = False
+                continue
+            break
+        else:
+            return None
+        
+        if response.status_code != 200:
+            logger.warning(f"NSE API returned {response.status_code}")
+            return None
+        
+        try:
+            items = response.json()
+        except ValueError:
+            logger.warning("NSE API returned invalid JSON")
+            return None
+        
+        if isinstance(items, dict):
+            items = items.get('data') or []
+        if not items:
+            return None
+        
+        structured_data = [self._api_record(item) for item in items]
+        logger.info(f"Fetched {len(structured_data)} records from NSE API")
+        
+        return {
+            'metadata': {
+                'scrape_timestamp': datetime.now().isoformat(),
+                'total_records': len(structured_data),
+                'total_pages': 1,
+                'market_type': self.market_type,
+                'source_url': NSE_API_URL,
+                'headers': API_HEADERS
+            },
+            'data': structured_data
+        }
+    
     def scrape_all_pages(self, max_pages=None):
         """
         Scrape all pages of announcements
@@ -239,8 +473,12 @@ class AnnouncementsMonitor:
             
             # Navigate to page
             logger.info(f"Navigating to: {self.url}")
-            self.driver.get(self.url)
-            time.sleep(5)  # Initial page load
+            # Reuse the live session: a refresh keeps the NSE cookies and
+            # connection warm instead of starting a fresh navigation
+            if self.driver.current_url.startswith(self.url):
+                self.driver.refresh()
+            else:
+                self.driver.get(self.url)
             
             # Select market type
             self._select_market_type()
@@ -251,30 +489,44 @@ class AnnouncementsMonitor:
                 return None
             
             # Get headers
-            headers = self._extract_table_headers()
+            snapshot = self._snapshot_table()
+            headers = self._extract_table_headers(snapshot)
             if not headers:
                 logger.warning("No headers found, using generic column names")
-                headers = ['SYMBOL', 'COMPANY NAME', 'SUBJECT', 'DETAILS', 'ATTACHMENT', 'XBRL', 'BROADCAST DATE/TIME']
+                headers = API_HEADERS
             
             logger.info(f"Table headers: {headers}")
             
             # Scrape all pages
             all_data = []
             page = 1
+            first_page_hash = None
             
             while True:
                 if max_pages and page > max_pages:
                     logger.info(f"Reached maximum page limit: {max_pages}")
                     break
                 
-                logger.info(f"Scraping page {page}...")
+                logger.debug("Scraping page %d...", page)
                 
-                page_data = self._extract_table_data()
+                page_data = self._extract_table_data(snapshot)
                 all_data.extend(page_data)
-                logger.info(f"Extracted {len(page_data)} rows from page {page}")
+                logger.debug("Extracted %d rows from page %d", len(page_data), page)
+                
+                # New entries appear at the top, so an unchanged first page
+                # means the rest of the previous scrape is still current
+                if page == 1:
+                    first_page_hash = hashlib.sha256(orjson.dumps(page_data)).hexdigest()
+                    previous = self.last_data['metadata'] if self.last_data else {}
+                    if previous.get('first_page_hash') == first_page_hash:
+                        logger.info("First page unchanged since last scrape, reusing previous data")
+                        return {
+                            'metadata': {**previous, 'scrape_timestamp': datetime.now().isoformat()},
+                            'data': self.last_data['data']
+                        }
                 
                 # Check if there's a next page
-                if not self._has_next_page():
+                if not self._has_next_page(snapshot):
                     logger.info("No more pages available")
                     break
                 
@@ -284,6 +536,7 @@ class AnnouncementsMonitor:
                     break
                 
                 page += 1
+                snapshot = self._snapshot_table()
                 
                 # Safety limit
                 if page > 100:
@@ -293,20 +546,15 @@ class AnnouncementsMonitor:
             logger.info(f"Total rows scraped: {len(all_data)}")
             
             # Convert to structured format
-            structured_data = []
-            for row in all_data:
-                if len(row) >= len(headers):
-                    row_dict = {}
-                    for i, header in enumerate(headers):
-                        row_dict[header] = row[i] if i < len(row) else ''
-                    structured_data.append(row_dict)
-                else:
-                    # Handle mismatched columns
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        header = headers[i] if i < len(headers) else f"Column_{i+1}"
-                        row_dict[header] = value
-                    structured_data.append(row_dict)
+            # zip builds each record in C and drops cells past the known
+            # headers; short rows are padded with blanks
+            header_tuple = tuple(headers)
+            width = len(header_tuple)
+            blanks = [''] * width
+            structured_data = [
+                dict(zip(header_tuple, row if len(row) >= width else row + blanks))
+                for row in all_data
+            ]
             
             # Create result object
             result = {
@@ -316,24 +564,29 @@ class AnnouncementsMonitor:
                     'total_pages': page,
                     'market_type': self.market_type,
                     'source_url': self.url,
-                    'headers': headers
+                    'headers': headers,
+                    'first_page_hash': first_page_hash
                 },
                 'data': structured_data
             }
             
             return result
             
+        except WebDriverException:
+            # Let run_single_scrape decide whether the session needs replacing
+            raise
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
             return None
     
-    def save_json(self, data, filename_prefix='announcements'):
+    def save_json(self, data, filename_prefix='announcements', pretty=True):
         """
         Save data to JSON file
         
         Args:
             data (dict): Data to save
             filename_prefix (str): Prefix for filename
+            pretty (bool): Indent the JSON for reading (compact if False)
         """
         if not data:
             logger.warning("No data to save")
@@ -349,8 +602,7 @@ class AnnouncementsMonitor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_atomic(filepath, data, option=orjson.OPT_INDENT_2 if pretty else None)
             
             logger.info(f"✅ Data saved to: {filepath}")
             logger.info(f"   Total records: {data['metadata']['total_records']}")
@@ -362,15 +614,51 @@ class AnnouncementsMonitor:
             return None
     
     def save_latest(self, data):
-        """Save data as 'latest.json' for easy access"""
+        """Save data as 'latest.json' for easy access
+
+        Also writes a small '.meta.json' sidecar with the record count and
+        scrape time so the API can report status without loading the data.
+        The data file itself is only rewritten when the rows have changed.
+        """
         if not data:
             return None
         
         filepath = os.path.join(self.output_dir, f'latest_{self.market_type.lower()}.json')
+        meta_path = os.path.join(self.output_dir, f'latest_{self.market_type.lower()}.meta.json')
+        hash_path = filepath + '.hash'
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Hash only the rows: the metadata gets a new timestamp on every
+            # scrape even when nothing else changed
+            content_hash = hashlib.blake2b(
+                orjson.dumps(data.get('data'), option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).hexdigest()
+            if self._last_hash is None and os.path.exists(hash_path):
+                with open(hash_path, 'r', encoding='utf-8') as f:
+                    self._last_hash = f.read().strip()
+            unchanged = content_hash == self._last_hash and os.path.exists(filepath)
+            
+            if not unchanged:
+                # Compact (unindented) JSON: this file is read by the API, not by
+                # people; the .meta.json sidecar is the human-readable summary
+                write_json_atomic(filepath, data)
+                with open(hash_path, 'w', encoding='utf-8') as f:
+                    f.write(content_hash)
+                self._last_hash = content_hash
+            
+            # The sidecar always records the latest scrape, so /health shows
+            # the monitor is alive even while the data itself is unchanged
+            metadata = data.get('metadata', {})
+            write_json_atomic(meta_path, {
+                'scrape_timestamp': metadata.get('scrape_timestamp'),
+                'total_records': metadata.get('total_records'),
+                'total_pages': metadata.get('total_pages'),
+            })
+            
+            if unchanged:
+                logger.info("Data unchanged since last save, kept existing snapshot")
+                return filepath
             
             logger.info(f"Updated latest_{self.market_type.lower()}.json")
             return filepath
@@ -383,21 +671,31 @@ class AnnouncementsMonitor:
         """Delete historical JSON files keeping only latest_*.json.
 
         This prevents the monitor from filling up disk over time when running
-        continuously in production.
+        continuously in production. Runs once at startup: nothing in the
+        monitoring loop creates such files. Also removes '.tmp' files left by
+        writes that a crash interrupted.
         """
         try:
-            for filename in os.listdir(self.output_dir):
-                if not filename.lower().endswith(".json"):
-                    continue
-                # Keep only latest_*.json files
-                if filename.startswith(f"latest_{self.market_type.lower()}"):
-                    continue
-                full_path = os.path.join(self.output_dir, filename)
-                try:
-                    os.remove(full_path)
-                    logger.info(f"Deleted old file: {full_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {full_path}: {e}")
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.endswith(".tmp"):
+                        pass  # Leftover of an interrupted atomic write
+                    elif not filename.lower().endswith(".json"):
+                        continue
+                    # Keep every market's latest_*.json; several markets can share
+                    # this directory
+                    elif filename.startswith("latest_"):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    try:
+                        os.remove(entry.path)
+                        logger.info(f"Deleted old file: {entry.path}")
+                    except OSError as e:
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not scan {self.output_dir} for cleanup: {e}")
     
     def run_single_scrape(self, max_pages=None):
         """Run a single scrape operation"""
@@ -406,14 +704,21 @@ class AnnouncementsMonitor:
         logger.info("=" * 80)
         
         try:
-            # Scrape data
-            data = self.scrape_all_pages(max_pages=max_pages)
+            # Prefer the JSON API; scrape the rendered table if it's unavailable
+            data = self.fetch_from_api()
+            if not data:
+                data = self.scrape_all_pages(max_pages=max_pages)
             
             if data:
+                self._driver_failures = 0
                 # Save only the latest snapshot used by the API
+                previous_hash = self._last_hash
                 self.save_latest(data)
-                # Cleanup any historical files left from previous runs
-                self.cleanup_old_files()
+                # Count unchanged scrapes so the monitor can back off
+                if self._last_hash == previous_hash:
+                    self._idle_ticks += 1
+                else:
+                    self._idle_ticks = 0
                 
                 # Store for comparison
                 self.last_data = data
@@ -425,13 +730,26 @@ class AnnouncementsMonitor:
                 logger.warning("⚠️ Scrape returned no data")
                 return None
                 
-        except Exception as e:
-            logger.error(f"❌ Error during scrape: {e}")
-            
-            # Try to reinitialize driver
+        except (InvalidSessionIdException, NoSuchWindowException) as e:
+            logger.error(f"❌ Browser session lost: {e}")
             logger.info("Attempting to reinitialize driver...")
+            self._driver_failures = 0
             self._init_driver()
-            
+            return None
+        
+        except WebDriverException as e:
+            # Timeouts and stale elements are usually transient; keep the
+            # session (and its NSE cookies) unless errors keep coming
+            self._driver_failures += 1
+            logger.error(f"❌ WebDriver error during scrape ({self._driver_failures}/{MAX_DRIVER_FAILURES}): {e}")
+            if self._driver_failures >= MAX_DRIVER_FAILURES:
+                logger.info("Attempting to reinitialize driver...")
+                self._driver_failures = 0
+                self._init_driver()
+            return None
+        
+        except Exception as e:
+            logger.error(f"❌ Error during scrape: {e}")
             return None
     
     def start_monitoring(self, interval_minutes=5, max_pages=None):
@@ -459,21 +777,35 @@ class AnnouncementsMonitor:
             logger.error("Failed to initialize driver. Exiting...")
             return
         
+        # Remove historical/temp files left from previous runs
+        self.cleanup_old_files()
+        
+        scrape_timeout = max(interval_minutes * 60 - SCRAPE_TIMEOUT_MARGIN_SECONDS, MIN_SCRAPE_TIMEOUT_SECONDS)
+        
+        # Ticks are counted on the monotonic clock from the first scrape, so
+        # scrape time does not push later runs back
+        next_run = time.monotonic()
+        
         # Run first scrape immediately
         logger.info("\n🚀 Running initial scrape...")
-        self.run_single_scrape(max_pages=max_pages)
+        self.run_with_timeout(scrape_timeout, max_pages=max_pages)
         
-        # Schedule periodic scraping
-        schedule.every(interval_minutes).minutes.do(lambda: self.run_single_scrape(max_pages=max_pages))
-        
-        logger.info(f"\n✅ Monitor started! Scraping every {interval_minutes} minutes.")
+        logger.info(f"\n✅ Monitor started! Scraping every {interval_minutes} minutes (up to {max(interval_minutes, MAX_INTERVAL_MINUTES)} while idle).")
         logger.info("Press Ctrl+C to stop.\n")
         
-        # Keep running
+        # Keep running: sleep until the next tick (or until stop() is called)
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+            while not self._stop.is_set():
+                interval = self.next_interval(interval_minutes)
+                logger.info(f"Next scrape in {interval / 60:g} minutes")
+                next_run += interval
+                delay = next_run - time.monotonic()
+                if delay <= 0:
+                    # The last scrape overran the interval; start over from now
+                    next_run = time.monotonic()
+                elif self._stop.wait(delay):
+                    break
+                self.run_with_timeout(scrape_timeout, max_pages=max_pages)
                 
         except KeyboardInterrupt:
             logger.info("\n\n⏹️  Monitor stopped by user")
@@ -481,9 +813,43 @@ class AnnouncementsMonitor:
         finally:
             self.cleanup()
     
+    def run_with_timeout(self, timeout, **kwargs):
+        """
+        Run run_single_scrape on the worker thread, giving up after timeout seconds
+        
+        On timeout the browser is quit, which makes the stuck WebDriver call
+        fail, and dropped, so the next scrape starts a new one. The worker
+        has a single thread, so that scrape waits for the stuck one to end
+        instead of sharing the driver.
+        """
+        future = self._executor.submit(self.run_single_scrape, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            logger.error(f"❌ Scrape still running after {timeout:.0f}s, closing the browser")
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            return None
+    
+    def next_interval(self, interval_minutes):
+        """Seconds until the next scrape, backing off while data is unchanged"""
+        backoff = interval_minutes * 2 ** min(self._idle_ticks, IDLE_BACKOFF_STEPS)
+        return min(backoff, max(interval_minutes, MAX_INTERVAL_MINUTES)) * 60
+    
+    def stop(self):
+        """Make start_monitoring return instead of waiting for the next tick"""
+        self._stop.set()
+    
     def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up...")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.session:
+            self.session.close()
         if self.driver:
             try:
                 self.driver.quit()
@@ -492,6 +858,78 @@ class AnnouncementsMonitor:
                 pass
 
 
+def monitor_markets(market_types, interval_minutes=5, max_pages=None, max_concurrency=4, headless=True):
+    """
+    Monitor several market types in parallel, one browser per market
+    
+    Each market gets its own AnnouncementsMonitor (and Chrome session) and
+    writes its own latest_<market>.json, so a scrape cycle takes roughly as
+    long as the slowest market instead of the sum of all of them.
+    
+    Args:
+        market_types (list): Market types to monitor (e.g. ['Equity', 'SME'])
+        interval_minutes (int): Interval between scrapes in minutes
+        max_pages (int): Maximum pages to scrape per run (None for all)
+        max_concurrency (int): Maximum Chrome instances scraping at once
+        headless (bool): Run browsers in headless mode
+    """
+    monitors = [
+        AnnouncementsMonitor(headless=headless, market_type=market_type)
+        for market_type in market_types
+    ]
+    
+    logger.info("=" * 80)
+    logger.info("NSE ANNOUNCEMENTS MONITOR (MULTI-MARKET)")
+    logger.info("=" * 80)
+    logger.info(f"Market Types: {', '.join(market_types)}")
+    logger.info(f"Interval: Every {interval_minutes} minutes")
+    logger.info(f"Max Concurrent Browsers: {max_concurrency}")
+    logger.info("=" * 80)
+    
+    # The pool size caps how many Chrome instances run at the same time
+    pool = ThreadPoolExecutor(max_workers=min(max_concurrency, len(monitors)))
+    
+    scrape_timeout = max(interval_minutes * 60 - SCRAPE_TIMEOUT_MARGIN_SECONDS, MIN_SCRAPE_TIMEOUT_SECONDS)
+    
+    def scrape_all_markets():
+        list(pool.map(lambda m: m.run_with_timeout(scrape_timeout, max_pages=max_pages), monitors))
+    
+    # Remove historical/temp files left from previous runs; every market
+    # shares the same output directory
+    monitors[0].cleanup_old_files()
+    
+    next_run = time.monotonic()
+    
+    # Run first scrape immediately
+    logger.info("\n🚀 Running initial scrape...")
+    scrape_all_markets()
+    
+    logger.info(f"\n✅ Monitor started! Scraping every {interval_minutes} minutes (up to {max(interval_minutes, MAX_INTERVAL_MINUTES)} while idle).")
+    logger.info("Press Ctrl+C to stop.\n")
+    
+    # Keep running
+    try:
+        while True:
+            # Back off only as far as the most active market allows
+            interval = min(m.next_interval(interval_minutes) for m in monitors)
+            logger.info(f"Next scrape in {interval / 60:g} minutes")
+            next_run += interval
+            delay = next_run - time.monotonic()
+            if delay <= 0:
+                next_run = time.monotonic()
+            else:
+                time.sleep(delay)
+            scrape_all_markets()
+            
+    except KeyboardInterrupt:
+        logger.info("\n\n⏹️  Monitor stopped by user")
+    
+    finally:
+        pool.shutdown(wait=False)
+        for monitor in monitors:
+            monitor.cleanup()
+
+
 def main():
     """Main execution function"""
     print("\n" + "=" * 80)
@@ -511,7 +949,7 @@ def main():
     print("  7. SSE")
     print("  8. DT Disclosures")
     
-    market_choice = input("\nSelect market type (1-8, default: 1): ").strip()
+    market_choice = input("\nSelect market type (1-8, comma-separated for several, default: 1): ").strip()
     
     market_types = {
         '1': 'Equity',
@@ -524,7 +962,9 @@ def main():
         '8': 'DT Disclosures'
     }
     
-    market_type = market_types.get(market_choice, 'Equity')
+    selected = [market_types[c.strip()] for c in market_choice.split(',') if c.strip() in market_types]
+    selected = list(dict.fromkeys(selected)) or ['Equity']
+    market_type = selected[0]
     
     # Ask for max pages (to limit scraping)
     max_pages_input = input("\nLimit pages per scrape (press Enter for all pages): ").strip()
@@ -535,15 +975,23 @@ def main():
     headless = headless_input != 'n'
     
     print("\nConfiguration:")
-    print(f"  - Market Type: {market_type}")
+    print(f"  - Market Type: {', '.join(selected)}")
     print(f"  - Interval: 5 minutes")
     print(f"  - Format: JSON")
     print(f"  - Output: announcements_data/")
-    print(f"  - Latest data: announcements_data/latest_{market_type.lower()}.json")
+    for market in selected:
+        print(f"  - Latest data: announcements_data/latest_{market.lower()}.json")
     if max_pages:
         print(f"  - Max Pages: {max_pages}")
     print()
     
+    if len(selected) > 1:
+        try:
+            monitor_markets(selected, interval_minutes=5, max_pages=max_pages, headless=headless)
+        except Exception as e:
+            logger.error(f"Fatal error: {e}")
+        return
+    
     # Create monitor
     monitor = AnnouncementsMonitor(
         headless=headless,
@@ -20,10 +20,12 @@ Usage:
     python api.py
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from flask_cors import CORS
-import json
+import orjson
 import os
+import time
+import zlib
 from datetime import datetime
 
 app = Flask(__name__)
@@ -40,25 +42,111 @@ CORS(app,
 def handle_preflight():
     """Handle CORS preflight requests"""
     if request.method == "OPTIONS":
-        response = jsonify({'status': 'ok'})
+        response = json_response({'status': 'ok'})
         response.headers.add("Access-Control-Allow-Origin", request.headers.get('Origin', '*'))
         response.headers.add('Access-Control-Allow-Headers', "Content-Type, Authorization")
         response.headers.add('Access-Control-Allow-Methods', "GET, OPTIONS")
         return response
 
 
+# Data file per monitor reported by /health
+HEALTH_FILES = {
+    'event_calendar': 'event_calendar_data/latest.json',
+    'announcements_equity': 'announcements_data/latest_equity.json',
+    'crd': 'crd_data/latest.json',
+    'credit_rating_equity': 'credit_rating_data/latest_equity.json'
+}
+
+# Health probes can arrive several times a second; their file checks are
+# reused for this many seconds. Holds (checked_at, files, snapshots).
+HEALTH_CACHE_TTL = 1.0
+_health_cache = None
+
+# Parsed JSON per file as {filepath: (mtime_ns, data)}. The monitors only
+# rewrite these files every few minutes, so requests in between reuse the
+# parsed copy and only pay for one os.stat() call.
+_json_cache = {}
+
+
 def load_json_file(filepath):
-    """Load JSON data from file"""
-    if not os.path.exists(filepath):
+    """Load JSON data from file, reusing the parsed copy until it changes"""
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
+    except OSError:
         return None
-    
+
+    cached = _json_cache.get(filepath)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return None
 
+    _json_cache[filepath] = (mtime, data)
+    return data
+
+
+def load_meta(filepath):
+    """Load the .meta.json sidecar the monitors write next to a latest*.json"""
+    return load_json_file(os.path.splitext(filepath)[0] + '.meta.json')
+
+
+def json_response(obj, code=200):
+    """Serialize obj with orjson (much faster than jsonify on large pages)"""
+    return Response(orjson.dumps(obj), status=code, mimetype='application/json')
+
+
+def stream_response(response, chunk_size=100):
+    """Stream a create_response() dict, encoding the data rows in chunks
+
+    The envelope (metadata/pagination) is encoded once, then the rows are
+    written out chunk_size at a time so a large page never exists as a
+    single serialized buffer.
+    """
+    rows = response['data']
+    envelope = {k: v for k, v in response.items() if k != 'data'}
+
+    def generate():
+        # Reopen the encoded envelope object to append the data array
+        yield orjson.dumps(envelope)[:-1] + b',"data":['
+        for i in range(0, len(rows), chunk_size):
+            chunk = b','.join(orjson.dumps(row) for row in rows[i:i + chunk_size])
+            yield chunk if i == 0 else b',' + chunk
+        yield b']}'
+
+    # Snapshot rows are very repetitive (same keys, similar URLs), so
+    # compress on the way out for clients that accept it
+    if 'gzip' in request.accept_encodings:
+        return Response(
+            gzip_chunks(generate()),
+            mimetype='application/json',
+            headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+        )
+
+    return Response(generate(), mimetype='application/json')
+
+
+def gzip_chunks(chunks, level=6):
+    """Gzip-compress a stream of byte chunks incrementally"""
+    # wbits=31 selects the gzip container rather than raw zlib
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def get_page_args():
+    """Read page/per_page query parameters, clamped to valid ranges"""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 1000)
+    return page, per_page
+
 
 def paginate_data(data, page=1, per_page=50):
     """Paginate data"""
@@ -69,9 +157,10 @@ def paginate_data(data, page=1, per_page=50):
     total_pages = (total + per_page - 1) // per_page
     
     start = (page - 1) * per_page
-    end = start + per_page
+    if start >= total:
+        return [], total, total_pages
     
-    return data[start:end], total, total_pages
+    return data[start:start + per_page], total, total_pages
 
 
 def create_response(data, metadata, page, per_page, total, total_pages):
@@ -99,16 +188,16 @@ def create_response(data, metadata, page, per_page, total, total_pages):
 
 def error_response(message, code=404):
     """Create error response"""
-    return jsonify({
+    return json_response({
         'success': False,
         'error': message
-    }), code
+    }, code)
 
 
 @app.route('/')
 def index():
     """API documentation"""
-    return jsonify({
+    return json_response({
         'name': 'NSE Data API',
         'version': '1.0',
         'endpoints': {
@@ -132,36 +221,56 @@ def index():
     })
 
 
+def monitor_status():
+    """Return (files, snapshots) for /health, cached for HEALTH_CACHE_TTL"""
+    global _health_cache
+    
+    now = time.monotonic()
+    if _health_cache and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1], _health_cache[2]
+    
+    # Check if data files exist; the sidecars carry each snapshot's
+    # timestamp and size without loading the data itself
+    files = {}
+    snapshots = {}
+    for name, filepath in HEALTH_FILES.items():
+        try:
+            os.stat(filepath)
+            files[name] = True
+        except OSError:
+            files[name] = False
+        meta = load_meta(filepath)
+        if meta:
+            snapshots[name] = meta
+    
+    _health_cache = (now, files, snapshots)
+    return files, snapshots
+
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    # Check if data files exist
-    files = {
-        'event_calendar': os.path.exists('event_calendar_data/latest.json'),
-        'announcements_equity': os.path.exists('announcements_data/latest_equity.json'),
-        'crd': os.path.exists('crd_data/latest.json'),
-        'credit_rating_equity': os.path.exists('credit_rating_data/latest_equity.json')
-    }
+    files, snapshots = monitor_status()
     
     # Count how many monitors have data
     ready_count = sum(files.values())
     all_healthy = all(files.values())
     
     # Always return 200 for Railway health check, but indicate status
-    return jsonify({
+    return json_response({
         'status': 'healthy' if all_healthy else 'starting' if ready_count > 0 else 'initializing',
         'timestamp': datetime.now().isoformat(),
         'monitors': files,
+        'snapshots': snapshots,
         'ready': f"{ready_count}/4"
-    }), 200
+    })
 
 
 @app.route('/event-calendar')
 def get_event_calendar():
     """Get event calendar data"""
     # Get query parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 50, type=int), 1000)
+    page, per_page = get_page_args()
     
     # Load data
     filepath = 'event_calendar_data/latest.json'
@@ -187,15 +296,14 @@ def get_event_calendar():
         total_pages
     )
     
-    return jsonify(response)
+    return stream_response(response)
 
 
 @app.route('/announcements')
 def get_announcements():
     """Get announcements data"""
     # Get query parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 50, type=int), 1000)
+    page, per_page = get_page_args()
     market = request.args.get('market', 'equity', type=str).lower()
     
     # Load data
@@ -226,15 +334,14 @@ def get_announcements():
         total_pages
     )
     
-    return jsonify(response)
+    return stream_response(response)
 
 
 @app.route('/crd')
 def get_crd():
     """Get CRD credit rating data"""
     # Get query parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 50, type=int), 1000)
+    page, per_page = get_page_args()
     
     # Load data
     filepath = 'crd_data/latest.json'
@@ -260,15 +367,14 @@ def get_crd():
         total_pages
     )
     
-    return jsonify(response)
+    return stream_response(response)
 
 
 @app.route('/credit-rating')
 def get_credit_rating():
     """Get credit rating regulation 30 data"""
     # Get query parameters
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 50, type=int), 1000)
+    page, per_page = get_page_args()
     market = request.args.get('market', 'equity', type=str).lower()
     
     # Load data
@@ -299,25 +405,25 @@ def get_credit_rating():
         total_pages
     )
     
-    return jsonify(response)
+    return stream_response(response)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
+    return json_response({
         'success': False,
         'error': 'Endpoint not found. Visit / for API documentation.'
-    }), 404
+    }, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    return jsonify({
+    return json_response({
         'success': False,
         'error': 'Internal server error'
-    }), 500
+    }, 500)
 
 
 if __name__ == '__main__':
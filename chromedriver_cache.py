@@ -0,0 +1,82 @@
+"""
+ChromeDriver Path Cache
+=======================
+
+ChromeDriverManager().install() asks the network for the newest driver every
+time it is called, which made every driver (re)initialization pay for an
+HTTP round-trip. The resolved path is remembered in-process and in a small
+file shared by all processes, and only revalidated once a week. Setting
+CHROMEDRIVER_PATH skips the lookup entirely (e.g. a driver baked into the
+image).
+
+Usage:
+    from chromedriver_cache import get_chromedriver_path
+    service = Service(get_chromedriver_path())
+"""
+
+import logging
+import os
+import threading
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'nse-monitor', 'chromedriver.txt')
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+_lock = threading.Lock()
+_cached = None  # (path, resolved_at)
+
+
+def _read_cache_file(now):
+    """Return (path, resolved_at) from the cache file if it is still fresh"""
+    try:
+        resolved_at = os.stat(CACHE_FILE).st_mtime
+        if now - resolved_at >= MAX_AGE_SECONDS:
+            return None
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+
+    if path and os.path.exists(path):
+        return path, resolved_at
+    return None
+
+
+def _write_cache_file(path):
+    """Remember path for other processes (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp_path = CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(path)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write chromedriver cache {CACHE_FILE}: {e}")
+
+
+def get_chromedriver_path():
+    """Return a chromedriver path, running ChromeDriverManager at most once a week"""
+    global _cached
+
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path:
+        return env_path
+
+    # The lock also keeps several monitor threads from installing at once
+    with _lock:
+        now = time.time()
+        if _cached and now - _cached[1] < MAX_AGE_SECONDS and os.path.exists(_cached[0]):
+            return _cached[0]
+
+        cached = _read_cache_file(now)
+        if cached is None:
+            path = ChromeDriverManager().install()
+            _write_cache_file(path)
+            cached = (path, now)
+
+        _cached = cached
+        return cached[0]
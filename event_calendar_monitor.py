@@ -20,27 +20,102 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+from chromedriver_cache import get_chromedriver_path
+from log_config import configure_logging
 from selenium.webdriver.chrome.service import Service
-import json
+import orjson
+import hashlib
 import time
 from datetime import datetime
 import logging
 import os
-import schedule
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('event_calendar_monitor.log'),
-        logging.StreamHandler()
-    ]
-)
+configure_logging('event_calendar_monitor.log')
 logger = logging.getLogger(__name__)
 
+# While scrapes keep returning unchanged data the interval doubles, at most
+# IDLE_BACKOFF_STEPS times and never beyond MAX_INTERVAL_MINUTES
+IDLE_BACKOFF_STEPS = 3
+MAX_INTERVAL_MINUTES = 30
+
+# A scrape is abandoned this long before the next one is due (but is always
+# given at least MIN_SCRAPE_TIMEOUT_SECONDS)
+SCRAPE_TIMEOUT_MARGIN_SECONDS = 30
+MIN_SCRAPE_TIMEOUT_SECONDS = 60
+
+# Consecutive WebDriver errors tolerated before the browser is restarted
+MAX_DRIVER_FAILURES = 3
+
+# Resources the table scrape never needs; blocked via CDP so page loads only
+# fetch the HTML and the scripts that render the table.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp',
+    '*.woff', '*.woff2', '*.ttf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+# Text of the first body row; used to tell when a tab switch or page change
+# has actually re-rendered the table.
+FIRST_ROW_TEXT_JS = """
+const row = document.querySelector('table tbody tr');
+return row ? row.textContent : null;
+"""
+
+# Clicks the Next button if it is enabled, found with querySelectorAll rather
+# than an XPath text() scan. Returns false when there is no next page,
+# otherwise the first row's text from before the click, in the same call.
+CLICK_NEXT_JS = """
+const next = Array.from(document.querySelectorAll('button'))
+    .find(button => button.textContent.includes('Next'));
+if (!next || next.disabled || next.className.includes('disabled')) {
+    return false;
+}
+const row = document.querySelector('table tbody tr');
+const firstRow = row ? row.textContent : null;
+next.click();
+return {firstRow: firstRow};
+"""
+
+# Reads headers, every row and the Next button state of the current table
+# page in a single browser round-trip instead of one WebDriver command per
+# cell. Written as an expression (not a function body) so it can go
+# straight to CDP Runtime.evaluate.
+TABLE_SNAPSHOT_JS = """
+(() => {
+const headers = Array.from(document.querySelectorAll('table thead th'))
+    .map(th => th.innerText.trim())
+    .filter(text => text);
+const rows = Array.from(document.querySelectorAll('table tbody tr'))
+    .map(tr => Array.from(tr.querySelectorAll('td')).map(td => {
+        const text = td.innerText.trim();
+        const link = td.querySelector('a');
+        return link && link.href ? {text: text, link: link.href} : text;
+    }))
+    .filter(cells => cells.length);
+const next = Array.from(document.querySelectorAll('button'))
+    .find(button => button.textContent.includes('Next'));
+const hasNext = !!next && !next.disabled && !next.className.includes('disabled');
+return {headers: headers, rows: rows, hasNext: hasNext};
+})()
+"""
+
+
+def write_json_atomic(filepath, obj, option=None):
+    """Write obj as JSON through a temp file so readers never see a partial file"""
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=option))
+        # Make the bytes durable before the rename, so a crash can't leave
+        # an empty file behind the new name
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
 
 class EventCalendarMonitor:
     """Monitor NSE Event Calendar page and scrape data every 5 minutes"""
@@ -58,6 +133,12 @@ class EventCalendarMonitor:
         self.driver = None
         self.headless = headless
         self.last_data = None
+        self._last_hash = None
+        self._stop = threading.Event()
+        self._idle_ticks = 0
+        # Scrapes run here so a hung browser can't block the monitor loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._driver_failures = 0
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
@@ -87,13 +168,26 @@ class EventCalendarMonitor:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Skip images and don't wait for subresources; the table is
+            # waited for explicitly once the DOM is ready
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+            options.page_load_strategy = 'eager'
+            
+            service = Service(get_chromedriver_path())
+            # Reuse one HTTP connection to chromedriver for every command
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.wait = WebDriverWait(self.driver, 20)
             
             # Hide webdriver property
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            self.driver.execute_cdp_cmd('Page.setAdBlockingEnabled', {'enabled': True})
+            
             logger.info("WebDriver initialized successfully")
             return True
             
@@ -102,86 +196,75 @@ class EventCalendarMonitor:
             return False
     
     def _wait_for_table(self):
-        """Wait for table to be present on page"""
+        """Wait for table rows to be present on page"""
         try:
             table = self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
             )
-            time.sleep(2)  # Additional wait for data to populate
             return True
         except TimeoutException:
             logger.error("Timeout waiting for table to load")
             return False
     
-    def _extract_table_headers(self):
-        """Extract table headers"""
+    def _first_row_text(self):
+        """Text of the first table row, or None if no rows are rendered yet"""
         try:
-            headers = self.driver.find_elements(By.CSS_SELECTOR, "table thead th")
-            return [h.text.strip() for h in headers if h.text.strip()]
-        except Exception as e:
-            logger.error(f"Error extracting headers: {e}")
-            return []
+            return self.driver.execute_script(FIRST_ROW_TEXT_JS)
+        except Exception:
+            return None
     
-    def _extract_table_data(self):
-        """Extract all data from current page"""
+    def _wait_for_table_change(self, old_first_row):
+        """Wait until the table shows rows different from old_first_row"""
         try:
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            data = []
-            
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if cells:
-                    row_data = []
-                    for cell in cells:
-                        # Get text, handle links
-                        text = cell.text.strip()
-                        
-                        # Try to get link if exists
-                        try:
-                            link = cell.find_element(By.TAG_NAME, "a")
-                            href = link.get_attribute('href')
-                            if href:
-                                text = {
-                                    'text': text,
-                                    'link': href
-                                }
-                        except NoSuchElementException:
-                            pass
-                        
-                        row_data.append(text)
-                    
-                    if row_data:
-                        data.append(row_data)
-            
-            return data
+            self.wait.until(lambda d: self._first_row_text() not in (None, old_first_row))
+            return True
+        except TimeoutException:
+            logger.warning("Timeout waiting for table content to change")
+            return False
+    
+    def _snapshot_table(self):
+        """Read table headers and rows in one CDP Runtime.evaluate call
+        
+        Going through CDP directly skips the WebDriver execute_script layer,
+        which matters for the large value a full page of rows returns.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': TABLE_SNAPSHOT_JS,
+                'returnByValue': True
+            })
+            if 'exceptionDetails' in result:
+                raise RuntimeError(result['exceptionDetails'].get('text', 'script error'))
+            return result['result'].get('value') or {'headers': [], 'rows': []}
         except Exception as e:
-            logger.error(f"Error extracting table data: {e}")
-            return []
+            logger.error(f"Error reading table snapshot: {e}")
+            return {'headers': [], 'rows': []}
+    
+    def _extract_table_headers(self, snapshot=None):
+        """Extract table headers"""
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        return snapshot.get('headers') or []
     
-    def _has_next_page(self):
+    def _extract_table_data(self, snapshot=None):
+        """Extract all data from current page"""
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        return snapshot.get('rows') or []
+    
+    def _has_next_page(self, snapshot=None):
         """Check if there's a next page available"""
-        try:
-            next_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[contains(text(), 'Next')]"
-            )
-            return next_button.is_enabled() and 'disabled' not in next_button.get_attribute('class')
-        except NoSuchElementException:
-            return False
+        if snapshot is None:
+            snapshot = self._snapshot_table()
+        return bool(snapshot.get('hasNext'))
     
     def _click_next_page(self):
         """Click next page button"""
         try:
-            next_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[contains(text(), 'Next')]"
-            )
-            
-            if next_button.is_enabled() and 'disabled' not in next_button.get_attribute('class'):
-                next_button.click()
-                time.sleep(3)  # Wait for page to load
-                return True
-            return False
+            clicked = self.driver.execute_script(CLICK_NEXT_JS)
+            if not clicked:
+                return False
+            return self._wait_for_table_change(clicked['firstRow'])
         except Exception as e:
             logger.error(f"Error clicking next page: {e}")
             return False
@@ -201,8 +284,12 @@ class EventCalendarMonitor:
             
             # Navigate to page
             logger.info(f"Navigating to: {self.url}")
-            self.driver.get(self.url)
-            time.sleep(5)  # Initial page load
+            # Reuse the live session: a refresh keeps the NSE cookies and
+            # connection warm instead of starting a fresh navigation
+            if self.driver.current_url.startswith(self.url):
+                self.driver.refresh()
+            else:
+                self.driver.get(self.url)
             
             # Wait for table
             if not self._wait_for_table():
@@ -210,7 +297,8 @@ class EventCalendarMonitor:
                 return None
             
             # Get headers
-            headers = self._extract_table_headers()
+            snapshot = self._snapshot_table()
+            headers = self._extract_table_headers(snapshot)
             if not headers:
                 logger.warning("No headers found, using generic column names")
                 # Common headers for event calendar
@@ -221,16 +309,29 @@ class EventCalendarMonitor:
             # Scrape all pages
             all_data = []
             page = 1
+            first_page_hash = None
             
             while True:
-                logger.info(f"Scraping page {page}...")
+                logger.debug("Scraping page %d...", page)
                 
-                page_data = self._extract_table_data()
+                page_data = self._extract_table_data(snapshot)
                 all_data.extend(page_data)
-                logger.info(f"Extracted {len(page_data)} rows from page {page}")
+                logger.debug("Extracted %d rows from page %d", len(page_data), page)
+                
+                # New entries appear at the top, so an unchanged first page
+                # means the rest of the previous scrape is still current
+                if page == 1:
+                    first_page_hash = hashlib.sha256(orjson.dumps(page_data)).hexdigest()
+                    previous = self.last_data['metadata'] if self.last_data else {}
+                    if previous.get('first_page_hash') == first_page_hash:
+                        logger.info("First page unchanged since last scrape, reusing previous data")
+                        return {
+                            'metadata': {**previous, 'scrape_timestamp': datetime.now().isoformat()},
+                            'data': self.last_data['data']
+                        }
                 
                 # Check if there's a next page
-                if not self._has_next_page():
+                if not self._has_next_page(snapshot):
                     logger.info("No more pages available")
                     break
                 
@@ -240,6 +341,7 @@ class EventCalendarMonitor:
                     break
                 
                 page += 1
+                snapshot = self._snapshot_table()
                 
                 # Safety limit
                 if page > 100:
@@ -249,20 +351,17 @@ class EventCalendarMonitor:
             logger.info(f"Total rows scraped: {len(all_data)}")
             
             # Convert to structured format
-            structured_data = []
-            for row in all_data:
-                if len(row) == len(headers):
-                    row_dict = {}
-                    for i, header in enumerate(headers):
-                        row_dict[header] = row[i]
-                    structured_data.append(row_dict)
-                else:
-                    # Handle mismatched columns
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        header = headers[i] if i < len(headers) else f"Column_{i+1}"
-                        row_dict[header] = value
-                    structured_data.append(row_dict)
+            # zip builds each record in C; short rows are padded with blanks
+            # and cells past the known headers get generic column names
+            width = len(headers)
+            blanks = [''] * width
+            header_tuple = tuple(headers) + tuple(
+                f"Column_{i+1}" for i in range(width, max(map(len, all_data), default=width))
+            )
+            structured_data = [
+                dict(zip(header_tuple, row if len(row) >= width else (row + blanks)[:width]))
+                for row in all_data
+            ]
             
             # Create result object
             result = {
@@ -271,24 +370,29 @@ class EventCalendarMonitor:
                     'total_records': len(structured_data),
                     'total_pages': page,
                     'source_url': self.url,
-                    'headers': headers
+                    'headers': headers,
+                    'first_page_hash': first_page_hash
                 },
                 'data': structured_data
             }
             
             return result
             
+        except WebDriverException:
+            # Let run_single_scrape decide whether the session needs replacing
+            raise
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
             return None
     
-    def save_json(self, data, filename_prefix='event_calendar'):
+    def save_json(self, data, filename_prefix='event_calendar', pretty=True):
         """
         Save data to JSON file
         
         Args:
             data (dict): Data to save
             filename_prefix (str): Prefix for filename
+            pretty (bool): Indent the JSON for reading (compact if False)
         """
         if not data:
             logger.warning("No data to save")
@@ -304,8 +408,7 @@ class EventCalendarMonitor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_atomic(filepath, data, option=orjson.OPT_INDENT_2 if pretty else None)
             
             logger.info(f"✅ Data saved to: {filepath}")
             logger.info(f"   Total records: {data['metadata']['total_records']}")
@@ -317,15 +420,51 @@ class EventCalendarMonitor:
             return None
     
     def save_latest(self, data):
-        """Save data as 'latest.json' for easy access"""
+        """Save data as 'latest.json' for easy access
+
+        Also writes a small '.meta.json' sidecar with the record count and
+        scrape time so the API can report status without loading the data.
+        The data file itself is only rewritten when the rows have changed.
+        """
         if not data:
             return None
         
         filepath = os.path.join(self.output_dir, 'latest.json')
+        meta_path = os.path.join(self.output_dir, 'latest.meta.json')
+        hash_path = filepath + '.hash'
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Hash only the rows: the metadata gets a new timestamp on every
+            # scrape even when nothing else changed
+            content_hash = hashlib.blake2b(
+                orjson.dumps(data.get('data'), option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).hexdigest()
+            if self._last_hash is None and os.path.exists(hash_path):
+                with open(hash_path, 'r', encoding='utf-8') as f:
+                    self._last_hash = f.read().strip()
+            unchanged = content_hash == self._last_hash and os.path.exists(filepath)
+            
+            if not unchanged:
+                # Compact (unindented) JSON: this file is read by the API, not by
+                # people; the .meta.json sidecar is the human-readable summary
+                write_json_atomic(filepath, data)
+                with open(hash_path, 'w', encoding='utf-8') as f:
+                    f.write(content_hash)
+                self._last_hash = content_hash
+            
+            # The sidecar always records the latest scrape, so /health shows
+            # the monitor is alive even while the data itself is unchanged
+            metadata = data.get('metadata', {})
+            write_json_atomic(meta_path, {
+                'scrape_timestamp': metadata.get('scrape_timestamp'),
+                'total_records': metadata.get('total_records'),
+                'total_pages': metadata.get('total_pages'),
+            })
+            
+            if unchanged:
+                logger.info("Data unchanged since last save, kept existing snapshot")
+                return filepath
             
             logger.info(f"Updated latest.json")
             return filepath
@@ -335,24 +474,33 @@ class EventCalendarMonitor:
             return None
     
     def cleanup_old_files(self):
-        """Delete historical JSON files keeping only latest.json.
+        """Delete historical JSON files keeping only latest.json and its sidecar.
 
         This prevents the monitor from filling up disk over time when running
-        continuously in production.
+        continuously in production. Runs once at startup: nothing in the
+        monitoring loop creates such files. Also removes '.tmp' files left by
+        writes that a crash interrupted.
         """
         try:
-            for filename in os.listdir(self.output_dir):
-                if not filename.lower().endswith(".json"):
-                    continue
-                # Keep only latest.json
-                if filename == "latest.json":
-                    continue
-                full_path = os.path.join(self.output_dir, filename)
-                try:
-                    os.remove(full_path)
-                    logger.info(f"Deleted old file: {full_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {full_path}: {e}")
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.endswith(".tmp"):
+                        pass  # Leftover of an interrupted atomic write
+                    elif not filename.lower().endswith(".json"):
+                        continue
+                    # Keep only latest.json and its .meta.json sidecar
+                    elif filename in ("latest.json", "latest.meta.json"):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    try:
+                        os.remove(entry.path)
+                        logger.info(f"Deleted old file: {entry.path}")
+                    except OSError as e:
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not scan {self.output_dir} for cleanup: {e}")
     
     def run_single_scrape(self):
         """Run a single scrape operation"""
@@ -365,10 +513,15 @@ class EventCalendarMonitor:
             data = self.scrape_all_pages()
             
             if data:
+                self._driver_failures = 0
                 # Save only the latest snapshot used by the API
+                previous_hash = self._last_hash
                 self.save_latest(data)
-                # Cleanup any historical files left from previous runs
-                self.cleanup_old_files()
+                # Count unchanged scrapes so the monitor can back off
+                if self._last_hash == previous_hash:
+                    self._idle_ticks += 1
+                else:
+                    self._idle_ticks = 0
                 
                 # Store for comparison
                 self.last_data = data
@@ -380,13 +533,26 @@ class EventCalendarMonitor:
                 logger.warning("⚠️ Scrape returned no data")
                 return None
                 
-        except Exception as e:
-            logger.error(f"❌ Error during scrape: {e}")
-            
-            # Try to reinitialize driver
+        except (InvalidSessionIdException, NoSuchWindowException) as e:
+            logger.error(f"❌ Browser session lost: {e}")
             logger.info("Attempting to reinitialize driver...")
+            self._driver_failures = 0
             self._init_driver()
-            
+            return None
+        
+        except WebDriverException as e:
+            # Timeouts and stale elements are usually transient; keep the
+            # session (and its NSE cookies) unless errors keep coming
+            self._driver_failures += 1
+            logger.error(f"❌ WebDriver error during scrape ({self._driver_failures}/{MAX_DRIVER_FAILURES}): {e}")
+            if self._driver_failures >= MAX_DRIVER_FAILURES:
+                logger.info("Attempting to reinitialize driver...")
+                self._driver_failures = 0
+                self._init_driver()
+            return None
+        
+        except Exception as e:
+            logger.error(f"❌ Error during scrape: {e}")
             return None
     
     def start_monitoring(self, interval_minutes=5):
@@ -410,21 +576,35 @@ class EventCalendarMonitor:
             logger.error("Failed to initialize driver. Exiting...")
             return
         
+        # Remove historical/temp files left from previous runs
+        self.cleanup_old_files()
+        
+        scrape_timeout = max(interval_minutes * 60 - SCRAPE_TIMEOUT_MARGIN_SECONDS, MIN_SCRAPE_TIMEOUT_SECONDS)
+        
+        # Ticks are counted on the monotonic clock from the first scrape, so
+        # scrape time does not push later runs back
+        next_run = time.monotonic()
+        
         # Run first scrape immediately
         logger.info("\n🚀 Running initial scrape...")
-        self.run_single_scrape()
-        
-        # Schedule periodic scraping
-        schedule.every(interval_minutes).minutes.do(self.run_single_scrape)
+        self.run_with_timeout(scrape_timeout)
         
-        logger.info(f"\n✅ Monitor started! Scraping every {interval_minutes} minutes.")
+        logger.info(f"\n✅ Monitor started! Scraping every {interval_minutes} minutes (up to {max(interval_minutes, MAX_INTERVAL_MINUTES)} while idle).")
         logger.info("Press Ctrl+C to stop.\n")
         
-        # Keep running
+        # Keep running: sleep until the next tick (or until stop() is called)
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+            while not self._stop.is_set():
+                interval = self.next_interval(interval_minutes)
+                logger.info(f"Next scrape in {interval / 60:g} minutes")
+                next_run += interval
+                delay = next_run - time.monotonic()
+                if delay <= 0:
+                    # The last scrape overran the interval; start over from now
+                    next_run = time.monotonic()
+                elif self._stop.wait(delay):
+                    break
+                self.run_with_timeout(scrape_timeout)
                 
         except KeyboardInterrupt:
             logger.info("\n\n⏹️  Monitor stopped by user")
@@ -432,9 +612,41 @@ class EventCalendarMonitor:
         finally:
             self.cleanup()
     
+    def run_with_timeout(self, timeout, **kwargs):
+        """
+        Run run_single_scrape on the worker thread, giving up after timeout seconds
+        
+        On timeout the browser is quit, which makes the stuck WebDriver call
+        fail, and dropped, so the next scrape starts a new one. The worker
+        has a single thread, so that scrape waits for the stuck one to end
+        instead of sharing the driver.
+        """
+        future = self._executor.submit(self.run_single_scrape, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            logger.error(f"❌ Scrape still running after {timeout:.0f}s, closing the browser")
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            return None
+    
+    def next_interval(self, interval_minutes):
+        """Seconds until the next scrape, backing off while data is unchanged"""
+        backoff = interval_minutes * 2 ** min(self._idle_ticks, IDLE_BACKOFF_STEPS)
+        return min(backoff, max(interval_minutes, MAX_INTERVAL_MINUTES)) * 60
+    
+    def stop(self):
+        """Make start_monitoring return instead of waiting for the next tick"""
+        self._stop.set()
+    
     def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up...")
+        self._executor.shutdown(wait=False, cancel_futures=True)
         if self.driver:
             try:
                 self.driver.quit()
@@ -16,13 +16,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from chromedriver_cache import get_chromedriver_path
 from selenium.webdriver.chrome.service import Service
-import json
+import atexit
+import hashlib
+import itertools
+import orjson
+import os
 import time
 from datetime import datetime
+from functools import lru_cache
 import logging
 import re
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from lxml import html
+from lxml.etree import XPath
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,19 +40,335 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Elements the browser lays out on lines of their own
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+])
+
+# Elements whose content is never rendered as text
+NON_TEXT_TAGS = frozenset(['head', 'noscript', 'script', 'style', 'svg', 'template', 'title'])
+
+DEFAULT_URL = "https://groww.in/share-market-today"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+STATIC_FETCH_TIMEOUT_SECONDS = 10
+
+# Requests the browser drops outright: analytics and ad scripts whose JS
+# never touches the news section, plus fonts and images
+BLOCKED_URL_PATTERNS = [
+    '*://*.google-analytics.com/*',
+    '*://*.googletagmanager.com/*',
+    '*://*.doubleclick.net/*',
+    '*://*.googlesyndication.com/*',
+    '*://*.facebook.com/*',
+    '*://*.facebook.net/*',
+    '*.woff', '*.woff2', '*.ttf',
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+]
+
+# Rendered pages are kept on disk for this long so re-runs skip Chrome
+PAGE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'groww_news')
+PAGE_CACHE_TTL_SECONDS = 10 * 60
+
+# Scrolls the page 500 px at a time in the browser, giving lazy-loaded
+# content 300 ms per step, and calls back with the final scrollHeight once
+# the bottom is reached and the height has held for two more steps, or as
+# soon as the page shows arguments[0] relative times ("... ago"). It parks
+# the view half way down before returning.
+SCROLL_TO_END_JS = """
+const enough = arguments[0];
+const done = arguments[arguments.length - 1];
+let last = 0, same = 0;
+function finish(h) {
+    window.scrollTo(0, h / 2);
+    done(h);
+}
+function step(y) {
+    window.scrollTo(0, y);
+    setTimeout(() => {
+        const h = document.body.scrollHeight;
+        if ((document.body.innerText.match(/\\bago\\b/g) || []).length >= enough) {
+            finish(h);
+        } else if (y < h) {
+            step(y + 500);
+        } else if (h === last && ++same > 1) {
+            finish(h);
+        } else {
+            last = h;
+            step(y + 500);
+        }
+    }, 300);
+}
+step(0);
+"""
+SCROLL_SCRIPT_TIMEOUT_SECONDS = 60
+# scrape_news_items stops at this many items, so scrolling can stop once
+# this many are on the page
+ENOUGH_NEWS_ITEMS = 15
+
+# Counts the elements whose text mentions 'ago' and returns that count with
+# the text, tag and class of the first few, as plain data in one reply
+AGO_SAMPLE_JS = """
+const limit = arguments[0];
+const found = document.evaluate("//*[contains(text(), 'ago')]", document, null,
+                                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const sample = [];
+for (let i = 0; i < Math.min(found.snapshotLength, limit); i++) {
+    const e = found.snapshotItem(i);
+    sample.push({text: (e.innerText || '').slice(0, 100), tag: e.tagName.toLowerCase(), cls: e.getAttribute('class')});
+}
+return [found.snapshotLength, sample];
+"""
+
+# Elements dropped from every page snapshot, browser or static, since their
+# content is never read (see NON_TEXT_TAGS) and they are most of the markup
+SNAPSHOT_DROP_TAGS = ('script', 'style', 'noscript', 'template', 'svg')
+
+# Serializes the rendered page in one call, minus SNAPSHOT_DROP_TAGS
+DOM_SNAPSHOT_JS = f"""
+const root = document.documentElement.cloneNode(true);
+root.querySelectorAll('{', '.join(SNAPSHOT_DROP_TAGS)}').forEach(e => e.remove());
+return root.outerHTML;
+"""
+
+def _ignore_case_xpath(pattern, value, needle):
+    """
+    Case-insensitive search without XPath translate()
+
+    pattern is a cheap case-sensitive pre-filter; its matches are kept when
+    needle is in value(element) lowercased.
+    """
+    xpath = XPath(pattern)
+
+    def search(root):
+        return [element for element in xpath(root) if needle in (value(element) or '').lower()]
+
+    return search
+
+
+# XPath expressions are compiled once here rather than re-parsed on every
+# call inside the ancestor loops. All are relative, so they can be evaluated
+# on the page root or on any container. Case-insensitive matches pre-filter
+# in XPath and lowercase the few hits in Python.
+HEADING_XPATHS = (
+    _ignore_case_xpath(".//*[contains(text(), 'ews') or contains(text(), 'EWS')]",
+                       lambda element: element.text, 'stocks in news'),
+    XPath(".//*[contains(text(), 'Stocks in news')]"),
+    XPath(".//*[contains(text(), 'Stocks in News')]"),
+    XPath(".//h2[contains(text(), 'news')]"),
+    XPath(".//h3[contains(text(), 'news')]"),
+    _ignore_case_xpath(".//*[contains(@class, 'ews') or contains(@class, 'EWS')]",
+                       lambda element: element.get('class'), 'news'),
+)
+AGO_XPATH = XPath(".//*[contains(text(), 'ago')]")
+AGO_ANY_CASE_XPATH = _ignore_case_xpath(".//*[contains(text(), 'go') or contains(text(), 'GO')]",
+                                        lambda element: element.text, 'ago')
+RELATIVE_TIME_XPATH = XPath(".//*[contains(text(), 'ago') and (contains(text(), 'hour') or contains(text(), 'minute'))]")
+ALL_DESCENDANTS_XPATH = XPath(".//*")
+# Elements with 'ago' or '%' in any of their own text nodes, not only the
+# first one that text() compares; libxml2 does the scan, Python only sees hits
+OWN_TEXT_AGO_XPATH = XPath(".//*[text()[contains(., 'ago') or contains(., 'Ago') or contains(., 'AGO')]]")
+OWN_TEXT_PERCENT_XPATH = XPath(".//*[text()[contains(., '%')]]")
+STOCK_LINK_XPATHS = tuple(XPath(pattern) for pattern in [
+    ".//a[contains(text(), '%')]",
+    ".//*[self::a or self::button][contains(text(), '%')]",
+    ".//*[@href and contains(text(), '%')]",
+])
+# Clickable-looking elements with a percentage: links, buttons and anything
+# classed as a button, stock or link, in one pass in document order
+STOCK_INFO_XPATH = XPath(
+    ".//*[contains(text(), '%')]"
+    "[self::a or self::button or @href or @role='link'"
+    " or contains(@class, 'button') or contains(@class, 'stock') or contains(@class, 'link')]"
+)
+
+# Relative timestamps ("2 hours ago") and percentage changes, for probing
+# candidate text in one scan
+TIME_AGO_RE = re.compile(r'\b(?:\d+|an?)\s*(?:hour|minute|day|second)s?\s+ago\b', re.IGNORECASE)
+PERCENT_RE = re.compile(r'[+-]?\d+(?:\.\d+)?\s*%')
+
+# Patterns for pulling fields out of a news item's text. AGO_RE replaces
+# "'ago' in text.lower()", without building a lowercased copy
+AGO_RE = re.compile('ago', re.IGNORECASE)
+NEWS_TIME_RE = re.compile(r'(\d+\s*(?:hour|minute|day)s?\s*ago)', re.IGNORECASE)
+# "Godrej Properties 1.04%" / "SBI -0.01%" in one pattern. It also matches
+# integer changes like "Infosys 2%", but the length check on the change
+# still rejects those, as before
+STOCK_RE = re.compile(r'([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+(?:\.\d+)?%)')
+DECIMAL_PERCENT_RE = re.compile(r'([-+]?\d+\.\d+%)')
+TRAILING_PUNCT_RE = re.compile(r'[.,\s]+$')
+ZERO_PERCENT_RE = re.compile(r'^0+%$')
+
+# Text that is page chrome rather than a headline. The skip patterns also
+# reject source/time ('ago') and stock ('%') text, in a single scan.
+INVALID_HEADLINES = ('no data available for this category', 'see more', 'view more')
+LINE_SKIP_RE = re.compile(r'ago|%|see more|view more|login|sign up|search', re.IGNORECASE)
+CHILD_SKIP_RE = re.compile(r'ago|%|see more|view more|login|no data available', re.IGNORECASE)
+
+# News outlets, in the order they are tried. Locating the section needs the
+# full 'CNBC TV18' label; single items accept any CNBC mention.
+SECTION_NEWS_SOURCES = ('CNBC TV18', 'Business Standard', 'The Hindu', 'Economic Times', 'News18', 'Zee Business')
+ITEM_NEWS_SOURCES = ('CNBC', 'Business Standard', 'The Hindu', 'Economic Times', 'News18', 'Zee Business')
+
+
+def _any_text_xpath(needles):
+    """Compile one XPath matching elements whose text contains any of needles"""
+    return XPath(".//*[" + " or ".join(f"contains(text(), '{needle}')" for needle in needles) + "]")
+
+
+SECTION_SOURCE_XPATH = _any_text_xpath(SECTION_NEWS_SOURCES)
+ITEM_SOURCE_XPATH = _any_text_xpath(ITEM_NEWS_SOURCES)
+
+
+def group_by_source(elements, sources):
+    """
+    Split the matches of a single source query by source
+
+    The result keeps the order of sources, and document order within each,
+    which is the order one query per source used to produce.
+    """
+    groups = {source: [] for source in sources}
+    for element in elements:
+        text = own_text(element)
+        for source in sources:
+            if source in text:
+                groups[source].append(element)
+    return groups
+
+
+def ancestors(element, start, stop):
+    """
+    element's ancestors from start up to (not including) stop, nearest first
+
+    Same as list(element.iterancestors())[start:stop], without walking up to
+    the root first.
+    """
+    return list(itertools.islice(element.iterancestors(), start, stop))
+
+
+def own_text(element):
+    """Text directly inside element, excluding its descendants' text"""
+    return (element.text or '') + ''.join(child.tail or '' for child in element)
+
+
+@lru_cache(maxsize=512)
+def parse_stock_text(text):
+    """
+    Extract stock name and percentage from an element's text
+
+    Pure and cached: the same stock label ("SBI -0.01%") recurs across the
+    candidates of one page, and repeats are answered without regex work.
+
+    Args:
+        text: Laid-out text, as from element_text
+
+    Returns:
+        tuple: (stock_name, stock_change) or (None, None)
+    """
+    try:
+        if not text or '%' not in text:
+            return None, None
+
+        # Name followed by a percentage, with or without decimals
+        for match in STOCK_RE.finditer(text):
+            stock_name = match.group(1).strip()
+            stock_change = match.group(2).strip()
+            # Validate
+            if stock_name and len(stock_name) > 1 and len(stock_name) < 50 and stock_name != '.':
+                if stock_change and len(stock_change) >= 4:  # At least "1.0%"
+                    return stock_name, stock_change
+
+        # Fallback: extract percentage and name separately
+        pct_match = DECIMAL_PERCENT_RE.search(text)
+        if pct_match:
+            stock_change = pct_match.group(1)
+            name_part = text[:pct_match.start()].strip()
+            name_part = TRAILING_PUNCT_RE.sub('', name_part)
+            if name_part and len(name_part) > 1 and len(name_part) < 50 and name_part != '.':
+                return name_part, stock_change
+
+        return None, None
+    except (AttributeError, TypeError):
+        return None, None
+
+
+def parse_page(page_html):
+    """Parse a page snapshot, dropping SNAPSHOT_DROP_TAGS like DOM_SNAPSHOT_JS does"""
+    root = html.fromstring(page_html)
+    for element in list(root.iter(*SNAPSHOT_DROP_TAGS)):
+        element.drop_tree()
+    return root
+
+
+def element_text(element):
+    """
+    Text of a parsed element, laid out like Selenium's element.text
+
+    Block elements start new lines and whitespace is collapsed, so the
+    line-based parsing below behaves as it did on the live page. CSS is not
+    applied, so text hidden with display:none is included.
+    """
+    parts = []
+    _collect_text(element, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _collect_text(element, parts):
+    """Append the text of element and its descendants (not its tail) to parts"""
+    # Comments and processing instructions have a non-string tag
+    if not isinstance(element.tag, str) or element.tag in NON_TEXT_TAGS:
+        return
+    block = element.tag in BLOCK_TAGS
+    if block:
+        parts.append('\n')
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append('\n')
+
 
 class GrowwStockNewsScraper:
     """Scraper for Groww Stock News section"""
     
-    def __init__(self, headless=False):
+    # One browser per (headless setting, thread), shared by every scraper
+    # running on that thread so repeat runs skip Chrome startup; quit at
+    # interpreter exit, or when scrape_many's worker threads are done
+    _shared_drivers = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, headless=False, url=DEFAULT_URL):
         """Initialize the scraper"""
-        self.url = "https://groww.in/share-market-today"
+        self.url = url
         self.headless = headless
         self.driver = None
         self.wait = None
+        self.page_html = None
+        self.static_page = False
     
     def _init_driver(self):
-        """Initialize web driver"""
+        """Initialize web driver, reusing the shared browser while it is alive"""
+        driver_key = (self.headless, threading.get_ident())
+        with GrowwStockNewsScraper._shared_lock:
+            shared = GrowwStockNewsScraper._shared_drivers.get(driver_key)
+        if shared is not None:
+            try:
+                shared.current_url
+                self.driver = shared
+                self.wait = WebDriverWait(self.driver, 20)
+                logger.info("Reusing existing WebDriver")
+                return True
+            except Exception:
+                logger.warning("Shared WebDriver is no longer responding, starting a new one")
+                with GrowwStockNewsScraper._shared_lock:
+                    GrowwStockNewsScraper._shared_drivers.pop(driver_key, None)
+        
         try:
             options = webdriver.ChromeOptions()
             if self.headless:
@@ -53,16 +379,32 @@ class GrowwStockNewsScraper:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            options.add_argument(f'--user-agent={USER_AGENT}')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--window-size=1920,1080')
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Skip images and don't wait for subresources; the news content
+            # is waited for explicitly once the DOM is ready
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+            options.page_load_strategy = 'eager'
+            
+            service = Service(get_chromedriver_path())
+            # Reuse one HTTP connection to chromedriver for every command
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.wait = WebDriverWait(self.driver, 20)
             
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.warning(f"Could not set blocked URLs, loading everything: {e}")
+            with GrowwStockNewsScraper._shared_lock:
+                GrowwStockNewsScraper._shared_drivers[driver_key] = self.driver
             
             logger.info("WebDriver initialized successfully")
             return True
@@ -77,31 +419,21 @@ class GrowwStockNewsScraper:
             logger.info(f"Navigating to: {self.url}")
             self.driver.get(self.url)
             
-            # Wait for page to load
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Wait for the document to be parsed, then for its scripts to
+            # stop adding content
+            self.wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
+            self._wait_dom_stable()
             logger.info("Initial page load complete")
             
-            # Wait for JavaScript to execute and content to load
-            time.sleep(5)
-            
-            # Scroll down gradually to trigger lazy loading
+            # Scroll down gradually to trigger lazy loading; the whole loop
+            # runs in the browser so it costs one round-trip, not one per step
             logger.info("Scrolling to load content...")
-            scroll_pause = 1
-            scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-            current_position = 0
-            scroll_step = 500
-            
-            while current_position < scroll_height:
-                self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                time.sleep(scroll_pause)
-                current_position += scroll_step
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height > scroll_height:
-                    scroll_height = new_height
-            
-            # Scroll back up a bit and wait for content to settle
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(3)
+            self.driver.set_script_timeout(SCROLL_SCRIPT_TIMEOUT_SECONDS)
+            try:
+                scroll_height = self.driver.execute_async_script(SCROLL_TO_END_JS, ENOUGH_NEWS_ITEMS)
+                logger.info(f"Scrolling done ({scroll_height}px page)")
+            except TimeoutException:
+                logger.warning("Page kept growing while scrolling, continuing with what has loaded...")
             
             # Try to wait for news-related elements
             try:
@@ -124,130 +456,202 @@ class GrowwStockNewsScraper:
             logger.error(f"Error loading page: {e}")
             return False
     
-    def find_news_section(self):
+    def _wait_dom_stable(self, timeout=5):
+        """
+        Wait until the page stops changing
+        
+        Polls document height and element count every 250 ms and returns
+        True once two consecutive polls agree, or False after timeout seconds.
+        """
+        last_state = []
+        
+        def settled(driver):
+            state = driver.execute_script(
+                "return [document.body.scrollHeight, document.getElementsByTagName('*').length]"
+            )
+            unchanged = last_state == [state]
+            last_state[:] = [state]
+            return unchanged
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(settled)
+            return True
+        except TimeoutException:
+            return False
+    
+    def load_page(self, force_refresh=False):
+        """
+        Get the page ready for scrape_all_news
+        
+        A rendered copy younger than PAGE_CACHE_TTL_SECONDS is reused from
+        disk without starting the browser. Otherwise a plain HTTP fetch is
+        tried first, since the server-rendered HTML often already holds the
+        news, and the browser is only started when it does not. Pass
+        force_refresh=True to skip the cache.
+        """
+        self.static_page = False
+        if not force_refresh:
+            self.page_html = self._cached_html()
+            if self.page_html is not None:
+                logger.info("Using cached copy of page, skipping browser")
+                return True
+        
+        self.page_html = self._try_static_fetch()
+        if self.page_html is not None:
+            logger.info("News found in static HTML, skipping browser")
+            # Cached by scrape_all_news once items are actually extracted
+            self.static_page = True
+            return True
+        
+        return self._load_rendered_page()
+    
+    def _load_rendered_page(self):
+        """Render the page in the browser and snapshot it into page_html"""
+        if self.driver is None and not self._init_driver():
+            return False
+        if not self.navigate_to_page():
+            return False
+        
+        self.page_html = self.driver.execute_script(DOM_SNAPSHOT_JS)
+        # Only cache pages that look rendered, so a bad load is not replayed
+        if 'ago' in self.page_html:
+            self._write_cached_html(self.page_html)
+        return True
+    
+    def _try_static_fetch(self):
+        """Return the page HTML if a plain GET already contains news items, else None"""
+        try:
+            response = requests.get(
+                self.url,
+                headers={'User-Agent': USER_AGENT},
+                timeout=STATIC_FETCH_TIMEOUT_SECONDS
+            )
+        except requests.RequestException as e:
+            logger.info(f"Static fetch failed, falling back to browser: {e}")
+            return None
+        
+        if response.ok:
+            # Checked on the visible text, so script data and words like
+            # "Chicago" do not count as news items
+            root = parse_page(response.text)
+            text = element_text(root)
+            if NEWS_TIME_RE.search(text) and any(source in text for source in ITEM_NEWS_SOURCES):
+                return html.tostring(root, encoding='unicode')
+        logger.info("Static HTML has no news items, falling back to browser")
+        return None
+    
+    def _cache_path(self):
+        """Cache file for this scraper's URL"""
+        digest = hashlib.sha1(self.url.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(PAGE_CACHE_DIR, f"{digest}.html")
+    
+    def _cached_html(self, ttl=PAGE_CACHE_TTL_SECONDS):
+        """Return the cached page if it is younger than ttl seconds, else None"""
+        path = self._cache_path()
+        try:
+            if time.time() - os.stat(path).st_mtime >= ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_cached_html(self, page_html):
+        """Store the rendered page for later runs (best effort)"""
+        path = self._cache_path()
+        try:
+            os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(page_html)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write page cache {path}: {e}")
+    
+    def _get_dom(self):
+        """
+        Snapshot the rendered page into an lxml tree
+        
+        One execute_script call replaces the hundreds of find_element/.text
+        round-trips to chromedriver that walking the live DOM took; every
+        lookup after this runs in-process. A page already fetched by
+        load_page is parsed instead.
+        """
+        page_html = self.page_html
+        if page_html is None:
+            page_html = self.driver.execute_script(DOM_SNAPSHOT_JS)
+        return parse_page(page_html)
+    
+    def find_news_section(self, root=None):
         """
         Find the 'Stocks in news' section container
         
+        Args:
+            root: Parsed page from _get_dom (taken now if not given)
+        
         Returns:
-            WebElement or None: The container element containing news items
+            lxml element or None: The container element containing news items
         """
         try:
             logger.info("Searching for 'Stocks in news' section...")
             
+            if root is None:
+                root = self._get_dom()
+            
             # Method 1: Look for heading containing "Stocks in news"
             try:
                 # Try multiple variations of the heading text
-                heading_patterns = [
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'stocks in news')]",
-                    "//*[contains(text(), 'Stocks in news')]",
-                    "//*[contains(text(), 'Stocks in News')]",
-                    "//h2[contains(text(), 'news')]",
-                    "//h3[contains(text(), 'news')]",
-                    "//*[@class and contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'news')]"
-                ]
-                
-                for pattern in heading_patterns:
-                    try:
-                        headings = self.driver.find_elements(By.XPATH, pattern)
-                        
-                        for heading in headings:
-                            try:
-                                text = heading.text.strip().lower()
-                                if 'stocks' in text and 'news' in text:
-                                    # Find the parent container - look for a div that contains multiple news items
-                                    # Try to find a container that has multiple time elements
-                                    for i in range(1, 10):
-                                        try:
-                                            container = heading.find_element(By.XPATH, f"./ancestor::*[position()={i}]")
-                                            # Check if this container has multiple news items
-                                            time_elements = container.find_elements(
-                                                By.XPATH,
-                                                ".//*[contains(text(), 'ago')]"
-                                            )
-                                            if len(time_elements) >= 2:
-                                                logger.info("Found news section via heading")
-                                                return container
-                                        except:
-                                            continue
-                            except:
-                                continue
-                    except:
-                        continue
+                for heading_xpath in HEADING_XPATHS:
+                    for heading in heading_xpath(root):
+                        text = element_text(heading).lower()
+                        if 'stocks' in text and 'news' in text:
+                            # Find the parent container - look for a div that contains multiple news items
+                            # Try to find a container that has multiple time elements
+                            for container in ancestors(heading, 0, 9):
+                                # Check if this container has multiple news items
+                                time_elements = AGO_XPATH(container)
+                                if len(time_elements) >= 2:
+                                    logger.info("Found news section via heading")
+                                    return container
             except Exception as e:
                 logger.debug(f"Method 1 (heading search) failed: {e}")
             
             # Method 2: Look for elements containing news source patterns (CNBC, Business Standard, etc.)
             try:
-                news_sources = ['CNBC TV18', 'Business Standard', 'The Hindu', 'Economic Times', 'News18', 'Zee Business']
+                # One DOM pass for all sources
+                grouped = group_by_source(SECTION_SOURCE_XPATH(root), SECTION_NEWS_SOURCES)
                 
-                for source in news_sources:
-                    try:
-                        elements = self.driver.find_elements(
-                            By.XPATH, 
-                            f"//*[contains(text(), '{source}')]"
-                        )
-                        
-                        if elements:
-                            # Find common parent container that contains multiple news items
-                            for element in elements:
-                                try:
-                                    # Try different ancestor levels
-                                    for level in range(3, 10):
-                                        try:
-                                            parent = element.find_element(By.XPATH, f"./ancestor::*[position()={level}]")
-                                            
-                                            # Check if this parent has multiple news-like elements
-                                            time_children = parent.find_elements(
-                                                By.XPATH,
-                                                ".//*[contains(text(), 'ago')]"
-                                            )
-                                            
-                                            if len(time_children) >= 3:  # Likely a news container
-                                                logger.info(f"Found news section via source pattern: {source}")
-                                                return parent
-                                        except:
-                                            continue
-                                except:
-                                    continue
-                    except:
-                        continue
+                for source, elements in grouped.items():
+                    # Find common parent container that contains multiple news items
+                    for element in elements:
+                        # Try different ancestor levels
+                        for parent in ancestors(element, 2, 9):
+                            # Check if this parent has multiple news-like elements
+                            time_children = AGO_XPATH(parent)
+                            
+                            if len(time_children) >= 3:  # Likely a news container
+                                logger.info(f"Found news section via source pattern: {source}")
+                                return parent
             except Exception as e:
                 logger.debug(f"Method 2 (source pattern) failed: {e}")
             
             # Method 3: Look for time patterns and find their common container
             try:
-                time_elements = self.driver.find_elements(
-                    By.XPATH,
-                    "//*[contains(text(), 'ago') and (contains(text(), 'hour') or contains(text(), 'minute'))]"
-                )
+                time_elements = RELATIVE_TIME_XPATH(root)
                 
-                if time_elements and len(time_elements) >= 2:
-                    # Get common ancestor of first few time elements
-                    try:
-                        # Get first time element's ancestors
-                        first_ancestors = []
-                        for i in range(1, 10):
-                            try:
-                                ancestor = time_elements[0].find_element(By.XPATH, f"./ancestor::*[position()={i}]")
-                                first_ancestors.append(ancestor)
-                            except:
-                                break
-                        
-                        # Check which ancestor contains multiple time elements
-                        for ancestor in reversed(first_ancestors):  # Start from deeper ancestors
-                            time_count = ancestor.find_elements(
-                                By.XPATH,
-                                ".//*[contains(text(), 'ago')]"
-                            )
-                            if len(time_count) >= 2:
-                                logger.info("Found news section via time pattern")
-                                return ancestor
-                    except:
-                        pass
+                if len(time_elements) >= 2:
+                    # Get first time element's ancestors
+                    first_ancestors = ancestors(time_elements[0], 0, 9)
+                    
+                    # Check which ancestor contains multiple time elements
+                    for ancestor in reversed(first_ancestors):  # Start from deeper ancestors
+                        time_count = AGO_XPATH(ancestor)
+                        if len(time_count) >= 2:
+                            logger.info("Found news section via time pattern")
+                            return ancestor
                     
-                    # Fallback: return first time element's parent
-                    first_time = time_elements[0]
-                    container = first_time.find_element(By.XPATH, "./ancestor::*[position()<=8]")
+                    # Fallback: the outermost of the first time element's 8 nearest ancestors
+                    container = first_ancestors[:8][-1]
                     logger.info("Found news section via time pattern (fallback)")
                     return container
             except Exception as e:
@@ -260,12 +664,13 @@ class GrowwStockNewsScraper:
             logger.error(f"Error finding news section: {e}")
             return None
     
-    def scrape_news_items(self, container=None):
+    def scrape_news_items(self, container=None, root=None):
         """
         Scrape all news items from the page
         
         Args:
             container: Optional container element to limit search scope
+            root: Parsed page from _get_dom (taken now if not given)
         
         Returns:
             list: List of news item dictionaries
@@ -274,59 +679,44 @@ class GrowwStockNewsScraper:
             logger.info("Scraping news items...")
             
             news_items = []
+            # Lowercased headlines already in news_items, shared by all methods
+            seen_headlines = set()
+            # Containers already extracted from, shared by methods 1 and 2.
+            # Parsed elements are their own identity: the set holds them, so
+            # the same container is always the same object
+            processed_containers = set()
+            
+            if root is None:
+                root = container.getroottree().getroot() if container is not None else self._get_dom()
             
             # If container is provided, search within it, otherwise search entire page
-            search_root = container if container else self.driver
+            search_root = container if container is not None else root
             
             # Debug: Check what's actually on the page
-            try:
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                if 'ago' in page_text.lower():
-                    logger.info("Found 'ago' text in page content")
-                if 'CNBC' in page_text or 'Business Standard' in page_text:
-                    logger.info("Found news sources in page content")
-            except:
-                pass
+            page_text = element_text(root)
+            if AGO_RE.search(page_text):
+                logger.info("Found 'ago' text in page content")
+            if 'CNBC' in page_text or 'Business Standard' in page_text:
+                logger.info("Found news sources in page content")
             
             # Method 1: Look for elements containing "ago" (time pattern)
             try:
-                # Try multiple XPath patterns to find time elements
-                time_patterns = [
-                    ".//*[contains(text(), 'ago')]",
-                    ".//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'ago')]",
-                ]
-                
-                time_elements = []
-                for pattern in time_patterns:
-                    try:
-                        elements = search_root.find_elements(By.XPATH, pattern)
-                        if elements:
-                            time_elements = elements
-                            logger.info(f"Found {len(elements)} elements with time patterns")
-                            break
-                    except:
-                        continue
+                # The case-insensitive match also covers plain 'ago'
+                time_elements = AGO_ANY_CASE_XPATH(search_root)
+                if time_elements:
+                    logger.info(f"Found {len(time_elements)} elements with time patterns")
                 
                 if not time_elements:
-                    # Try finding by partial text match (limited search)
+                    # Check every element's own text, which also catches 'ago'
+                    # after an inline child that text() misses
                     logger.info("Trying alternative method to find time elements...")
-                    all_elements = search_root.find_elements(By.XPATH, ".//*")
-                    checked = 0
-                    for elem in all_elements:
-                        if checked > 500:  # Limit search
-                            break
-                        checked += 1
-                        try:
-                            text = elem.text or ""
-                            if 'ago' in text.lower() and ('hour' in text.lower() or 'minute' in text.lower()):
-                                time_elements.append(elem)
-                                if len(time_elements) >= 20:  # Limit to 20
-                                    break
-                        except:
-                            continue
+                    for elem in OWN_TEXT_AGO_XPATH(search_root):
+                        if TIME_AGO_RE.search(own_text(elem)):
+                            time_elements.append(elem)
+                            if len(time_elements) >= 20:  # Limit to 20
+                                break
                     logger.info(f"Found {len(time_elements)} elements with time patterns (alternative method)")
                 
-                processed_containers = set()
                 logger.info(f"Processing {len(time_elements)} time elements...")
                 
                 for idx, time_element in enumerate(time_elements[:30], 1):  # Limit to first 30
@@ -335,44 +725,26 @@ class GrowwStockNewsScraper:
                     
                     try:
                         # Get the parent container that should contain the full news item
-                        # Try different ancestor levels
-                        extracted = False
-                        for level in range(4, 7):  # Reduced range
-                            try:
-                                parent = time_element.find_element(By.XPATH, f"./ancestor::*[position()={level}]")
-                                
-                                # Get a unique identifier for this container
-                                try:
-                                    container_id = parent.get_attribute('outerHTML')[:200] if parent else str(id(parent))
-                                except:
-                                    container_id = str(id(parent))
-                                
-                                if container_id in processed_containers:
-                                    continue
-                                
-                                # Check if this container looks like a news item container
-                                container_text = parent.text if parent else ""
-                                if len(container_text) > 50 and ('%' in container_text or '₹' in container_text):
-                                    processed_containers.add(container_id)
-                                    
-                                    # Extract news data from this container
-                                    news_data = self._extract_news_from_container(parent)
-                                    
-                                    if news_data and news_data.get('headline'):
-                                        headline = news_data.get('headline', '')
-                                        # Validate headline
-                                        if len(headline) > 20 and headline.lower() not in ['no data available for this category', 'see more', 'view more']:
-                                            # Check if we already have this headline
-                                            if not any(item.get('headline', '').lower() == headline.lower() for item in news_items):
-                                                news_items.append(news_data)
-                                                logger.info(f"✓ Extracted news {len(news_items)}: {headline[:60]}... | Stock: {news_data.get('stock_name', 'N/A')} {news_data.get('stock_change', 'N/A')}")
-                                                extracted = True
-                                                break
-                            except:
-                                continue
+                        parent, container_text = self._first_news_container(time_element, processed_containers)
+                        if parent is not None:
+                            processed_containers.add(parent)
+                            
+                            # Extract news data from this container
+                            news_data = self._extract_news_from_container(parent, container_text)
+                            
+                            if news_data and news_data.get('headline'):
+                                headline = news_data.get('headline', '')
+                                # Validate headline
+                                if len(headline) > 20 and headline.lower() not in INVALID_HEADLINES:
+                                    # Check if we already have this headline
+                                    headline_key = headline.lower()
+                                    if headline_key not in seen_headlines:
+                                        seen_headlines.add(headline_key)
+                                        news_items.append(news_data)
+                                        logger.info(f"✓ Extracted news {len(news_items)}: {headline[:60]}... | Stock: {news_data.get('stock_name', 'N/A')} {news_data.get('stock_change', 'N/A')}")
                         
                         # Early exit if we have enough items
-                        if len(news_items) >= 15:
+                        if len(news_items) >= ENOUGH_NEWS_ITEMS:
                             logger.info(f"Found {len(news_items)} news items, stopping early...")
                             break
                     
@@ -392,37 +764,21 @@ class GrowwStockNewsScraper:
                     logger.info("Trying alternative method: searching for stock links...")
                     
                     # Try multiple patterns for stock links
-                    link_patterns = [
-                        ".//a[contains(text(), '%')]",
-                        ".//*[self::a or self::button][contains(text(), '%')]",
-                        ".//*[@href and contains(text(), '%')]",
-                    ]
-                    
                     stock_links = []
-                    for pattern in link_patterns:
-                        try:
-                            links = search_root.find_elements(By.XPATH, pattern)
-                            if links:
-                                stock_links = links
-                                logger.info(f"Found {len(links)} stock links using pattern: {pattern}")
-                                break
-                        except:
-                            continue
+                    for link_xpath in STOCK_LINK_XPATHS:
+                        links = link_xpath(search_root)
+                        if links:
+                            stock_links = links
+                            logger.info(f"Found {len(links)} stock links using pattern: {link_xpath.path}")
+                            break
                     
                     # If no links found, try finding any element with percentage
                     if not stock_links:
-                        all_elements = search_root.find_elements(By.XPATH, ".//*")
-                        for elem in all_elements:
-                            try:
-                                text = elem.text or ""
-                                if '%' in text and any(char.isdigit() for char in text):
-                                    stock_links.append(elem)
-                            except:
-                                continue
+                        for elem in OWN_TEXT_PERCENT_XPATH(search_root):
+                            if PERCENT_RE.search(own_text(elem)):
+                                stock_links.append(elem)
                         logger.info(f"Found {len(stock_links)} elements with percentage (alternative method)")
                     
-                    processed_links = set()
-                    processed_containers = set()
                     total_links = len(stock_links)
                     logger.info(f"Processing {total_links} stock elements...")
                     
@@ -430,21 +786,18 @@ class GrowwStockNewsScraper:
                     # Filter elements that look like stock info (not just random percentages)
                     promising_links = []
                     for link in stock_links[:100]:  # Check first 100
-                        try:
-                            link_text = link.text or ""
-                            # Skip if too long (likely not stock info)
-                            if len(link_text) > 60 or len(link_text) < 5:
-                                continue
-                            # Skip if contains "ago" (it's source/time)
-                            if 'ago' in link_text.lower():
-                                continue
-                            # Must have percentage and some letters (stock name)
-                            if '%' in link_text and any(char.isalpha() for char in link_text):
-                                promising_links.append(link)
-                                if len(promising_links) >= 30:  # Limit to 30 most promising
-                                    break
-                        except:
+                        link_text = element_text(link)
+                        # Skip if too long (likely not stock info)
+                        if len(link_text) > 60 or len(link_text) < 5:
                             continue
+                        # Skip if contains "ago" (it's source/time)
+                        if AGO_RE.search(link_text):
+                            continue
+                        # Must have percentage and some letters (stock name)
+                        if '%' in link_text and any(char.isalpha() for char in link_text):
+                            promising_links.append(link)
+                            if len(promising_links) >= 30:  # Limit to 30 most promising
+                                break
                     
                     logger.info(f"Found {len(promising_links)} promising stock elements to process")
                     
@@ -453,35 +806,25 @@ class GrowwStockNewsScraper:
                             if idx % 5 == 0:
                                 logger.info(f"Processing element {idx}/{len(promising_links)}...")
                             
-                            link_text = link.text or ""
-                            if link_text in processed_links:
-                                continue
-                            processed_links.add(link_text)
-                            
                             # Get parent container - try different levels
                             extracted = False
-                            for level in range(4, 7):  # Reduced range for speed
+                            for parent in ancestors(link, 3, 6):  # Reduced range for speed
                                 try:
-                                    parent = link.find_element(By.XPATH, f"./ancestor::*[position()={level}]")
-                                    
                                     # Skip if we've already processed this container
-                                    try:
-                                        container_id = parent.get_attribute('outerHTML')[:200] if parent else str(id(parent))
-                                    except:
-                                        container_id = str(id(parent))
-                                    
-                                    if container_id in processed_containers:
+                                    if parent in processed_containers:
                                         continue
-                                    processed_containers.add(container_id)
+                                    processed_containers.add(parent)
                                     
                                     news_data = self._extract_news_from_container(parent)
                                     
                                     if news_data and news_data.get('headline'):
                                         headline = news_data.get('headline', '')
                                         # Validate headline
-                                        if len(headline) > 20 and headline.lower() not in ['no data available for this category', 'see more', 'view more']:
+                                        if len(headline) > 20 and headline.lower() not in INVALID_HEADLINES:
                                             # Check for duplicates
-                                            if not any(item.get('headline', '').lower() == headline.lower() for item in news_items):
+                                            headline_key = headline.lower()
+                                            if headline_key not in seen_headlines:
+                                                seen_headlines.add(headline_key)
                                                 news_items.append(news_data)
                                                 logger.info(f"✓ Extracted news {len(news_items)}: {headline[:60]}... | Stock: {news_data.get('stock_name', 'N/A')} {news_data.get('stock_change', 'N/A')}")
                                                 extracted = True
@@ -490,7 +833,7 @@ class GrowwStockNewsScraper:
                                     continue
                             
                             # If we've found enough items, we can stop early
-                            if len(news_items) >= 15:
+                            if len(news_items) >= ENOUGH_NEWS_ITEMS:
                                 logger.info(f"Found {len(news_items)} news items, stopping early...")
                                 break
                                 
@@ -508,46 +851,29 @@ class GrowwStockNewsScraper:
             if len(news_items) < 10:
                 try:
                     logger.info("Trying method 3: searching by news sources...")
-                    news_sources = ['CNBC', 'Business Standard', 'The Hindu', 'Economic Times', 'News18', 'Zee Business']
+                    # One DOM pass for all sources
+                    grouped = group_by_source(ITEM_SOURCE_XPATH(search_root), ITEM_NEWS_SOURCES)
                     
-                    for source in news_sources:
-                        try:
-                            source_elements = search_root.find_elements(
-                                By.XPATH,
-                                f".//*[contains(text(), '{source}')]"
-                            )
-                            
-                            for source_elem in source_elements:
-                                try:
-                                    # Get parent container
-                                    for level in range(2, 7):
-                                        try:
-                                            parent = source_elem.find_element(By.XPATH, f"./ancestor::*[position()={level}]")
-                                            news_data = self._extract_news_from_container(parent)
-                                            
-                                            if news_data and news_data.get('headline'):
-                                                if not any(item.get('headline', '').lower() == news_data.get('headline', '').lower() for item in news_items):
-                                                    news_items.append(news_data)
-                                                    logger.debug(f"Extracted news from source: {news_data.get('headline', '')[:50]}...")
-                                                    break
-                                        except:
-                                            continue
-                                except:
-                                    continue
-                        except:
-                            continue
+                    for source, source_elements in grouped.items():
+                        for source_elem in source_elements:
+                            # Get parent container
+                            for parent in ancestors(source_elem, 1, 6):
+                                news_data = self._extract_news_from_container(parent)
+                                
+                                if news_data and news_data.get('headline'):
+                                    headline_key = news_data['headline'].lower()
+                                    if headline_key not in seen_headlines:
+                                        seen_headlines.add(headline_key)
+                                        news_items.append(news_data)
+                                        logger.debug(f"Extracted news from source: {news_data.get('headline', '')[:50]}...")
+                                        break
                 except Exception as e:
                     logger.warning(f"Method 3 failed: {e}")
             
-            # Remove duplicates based on headline
-            unique_items = []
-            seen_headlines = set()
-            
-            for item in news_items:
-                headline_key = item.get('headline', '').lower().strip()
-                if headline_key and headline_key not in seen_headlines and len(headline_key) > 10:
-                    seen_headlines.add(headline_key)
-                    unique_items.append(item)
+            # Every method checked seen_headlines before appending, and
+            # _extract_news_from_container only returns headlines over 20
+            # characters, so news_items is already unique
+            unique_items = news_items
             
             logger.info(f"Scraped {len(unique_items)} unique news items")
             
@@ -571,60 +897,60 @@ class GrowwStockNewsScraper:
             logger.error(traceback.format_exc())
             return []
     
+    def _first_news_container(self, time_element, processed_containers):
+        """
+        Nearest ancestor of a time element (4 to 6 levels up) that looks like
+        a news item: over 50 characters of text with a price or percentage
+        
+        Returns:
+            tuple: (container, container_text), or (None, None) if no
+            unprocessed ancestor qualifies
+        """
+        for parent in ancestors(time_element, 3, 6):
+            if parent in processed_containers:
+                continue
+            container_text = element_text(parent)
+            if len(container_text) > 50 and ('%' in container_text or '₹' in container_text):
+                return parent, container_text
+        return None, None
+    
     def _extract_stock_info_from_element(self, element):
         """
         Extract stock name and percentage from an element
         
         Args:
-            element: WebElement that should contain stock info
+            element: Parsed element that should contain stock info
         
         Returns:
             tuple: (stock_name, stock_change) or (None, None)
         """
-        try:
-            text = element.text.strip() if element else ""
-            if not text or '%' not in text:
-                return None, None
-            
-            # Patterns to match stock info
-            patterns = [
-                re.compile(r'^([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+\.\d+%)$', re.IGNORECASE),  # Full match
-                re.compile(r'([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+\.\d+%)', re.IGNORECASE),   # Partial match
-                re.compile(r'([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+%)', re.IGNORECASE),        # Without decimal
-            ]
-            
-            for pattern in patterns:
-                match = pattern.search(text)
-                if match:
-                    stock_name = match.group(1).strip()
-                    stock_change = match.group(2).strip()
-                    # Validate
-                    if stock_name and len(stock_name) > 1 and len(stock_name) < 50 and stock_name != '.':
-                        if stock_change and len(stock_change) >= 4:  # At least "1.0%"
-                            return stock_name, stock_change
-            
-            # Fallback: extract percentage and name separately
-            pct_match = re.search(r'([-+]?\d+\.\d+%)', text)
-            if pct_match:
-                stock_change = pct_match.group(1)
-                name_part = text[:pct_match.start()].strip()
-                name_part = re.sub(r'[.,\s]+$', '', name_part)
-                if name_part and len(name_part) > 1 and len(name_part) < 50 and name_part != '.':
-                    return name_part, stock_change
-            
-            return None, None
-        except:
-            return None, None
+        text = element_text(element) if element is not None else ""
+        return parse_stock_text(text)
     
-    def _extract_news_from_container(self, container):
+    def _descendant_texts(self, container):
+        """
+        (element, text) for every descendant of container that has text
+        
+        Both fallbacks in _extract_news_from_container scan the same list,
+        so each descendant's text is laid out once per container.
+        """
+        texts = []
+        for elem in ALL_DESCENDANTS_XPATH(container):
+            text = element_text(elem)
+            if text:
+                texts.append((elem, text))
+        return texts
+    
+    def _extract_news_from_container(self, container, container_text=None):
         """
         Extract news data from a container element that contains a full news item
         
         Args:
-            container: WebElement container that should have:
+            container: Parsed container element that should have:
                 - Child with source/time
                 - Child with headline
                 - Link with stock info
+            container_text: element_text(container), if the caller has it
         
         Returns:
             dict or None: News data dictionary
@@ -639,173 +965,80 @@ class GrowwStockNewsScraper:
             }
             
             # Get full text from container
-            container_text = container.text if container else ""
+            if container_text is None:
+                container_text = element_text(container) if container is not None else ""
             
             if not container_text or len(container_text) < 20:
                 return None
             
             # Split into lines for analysis
-            lines = [line.strip() for line in container_text.split('\n') if line.strip()]
+            lines = [line for line in map(str.strip, container_text.splitlines()) if line]
             
             if len(lines) < 2:
                 return None
             
+            # Filled on first use by the descendant-scanning fallbacks
+            descendant_texts = None
+            
             # Method 1: Find source/time (contains "ago")
-            try:
-                time_pattern = re.compile(r'(\d+\s*(?:hour|minute|day)s?\s*ago)', re.IGNORECASE)
-                
-                # Look through lines for time pattern
-                for line in lines:
-                    if 'ago' in line.lower():
-                        # Parse "Source - X hours ago" or "Source · X hours ago" or "Source X hours ago"
-                        # Try "-" separator first (most common based on image)
-                        if ' - ' in line or line.count('-') == 1:
-                            parts = line.split('-', 1)
-                            if len(parts) >= 2:
-                                news_data['source'] = parts[0].strip()
-                                time_part = parts[1].strip()
-                                time_match = time_pattern.search(time_part)
-                                if time_match:
-                                    news_data['time'] = time_match.group(1)
-                        elif '·' in line:
-                            parts = line.split('·')
-                            if len(parts) >= 2:
-                                news_data['source'] = parts[0].strip()
-                                time_part = parts[1].strip()
-                                time_match = time_pattern.search(time_part)
-                                if time_match:
-                                    news_data['time'] = time_match.group(1)
-                        else:
-                            # Try to extract time and source from same line
-                            time_match = time_pattern.search(line)
-                            if time_match:
-                                news_data['time'] = time_match.group(1)
-                                # Source is everything before time
-                                source_part = line[:time_match.start()].strip()
-                                # Remove common separators
-                                news_data['source'] = source_part.replace('·', '').replace('-', '').strip()
+            # Skipped when no line can hold a relative time
+            if AGO_RE.search(container_text):
+                try:
+                    # The first line with a relative time is the source/time line
+                    for line in lines:
+                        if not AGO_RE.search(line):
+                            continue
+                        time_match = NEWS_TIME_RE.search(line)
+                        if not time_match:
+                            continue
+                        news_data['time'] = time_match.group(1)
+                        # "Source - X hours ago", "Source · X hours ago" or
+                        # "Source X hours ago": the source is what precedes
+                        # the time, minus the separator
+                        news_data['source'] = line[:time_match.start()].rstrip(' -·')
                         break
-            except Exception as e:
-                logger.debug(f"Error extracting source/time: {e}")
+                except Exception as e:
+                    logger.debug(f"Error extracting source/time: {e}")
             
             # Method 2: Find headline (longest line that's not source/time or stock info)
             try:
-                for line in lines:
-                    # Skip if it's source/time or stock info
-                    if 'ago' in line.lower() or '%' in line:
-                        continue
-                    
-                    # Skip very short lines
-                    if len(line) < 30:
-                        continue
-                    
-                    # Skip if it looks like navigation or UI text
-                    if any(skip in line.lower() for skip in ['see more', 'view more', 'login', 'sign up', 'search']):
-                        continue
-                    
-                    # This is likely the headline
-                    if len(line) > len(news_data.get('headline', '')):
-                        news_data['headline'] = line
+                # Skip very short lines, source/time, stock info and UI text;
+                # the longest remaining line is likely the headline (first on ties)
+                candidates = (line for line in lines if len(line) >= 30 and not LINE_SKIP_RE.search(line))
+                news_data['headline'] = max(candidates, key=len, default='')
             except Exception as e:
                 logger.debug(f"Error extracting headline: {e}")
             
             # Method 3: Find stock info (contains "%")
-            try:
-                # Improved pattern: Stock name (letters, spaces, common punctuation) followed by percentage
-                # Pattern should match: "Godrej Properties 1.04%" or "SBI -0.01%"
-                # Use more flexible pattern that handles various formats
-                stock_pattern_full = re.compile(r'([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+\.\d+%)', re.IGNORECASE)
-                stock_pattern_simple = re.compile(r'([A-Za-z][A-Za-z\s&.,()]+?)\s+([-+]?\d+%)', re.IGNORECASE)
-                pct_pattern = re.compile(r'([-+]?\d+\.\d+%)', re.IGNORECASE)
-                
-                # First try to find in links/buttons (stock info is usually in a clickable element)
+            # Skipped when no line can hold a percentage
+            if '%' in container_text:
                 try:
-                    # Try multiple selectors for stock info elements
-                    stock_selectors = [
-                        ".//a[contains(text(), '%')]",
-                        ".//*[@href and contains(text(), '%')]",
-                        ".//button[contains(text(), '%')]",
-                        ".//*[contains(@class, 'button') and contains(text(), '%')]",
-                        ".//*[contains(@class, 'stock') and contains(text(), '%')]",
-                        ".//*[contains(@class, 'link') and contains(text(), '%')]",
-                        ".//*[@role='link' and contains(text(), '%')]",
-                    ]
-                    
-                    stock_elements = []
-                    for selector in stock_selectors:
-                        try:
-                            elements = container.find_elements(By.XPATH, selector)
-                            if elements:
-                                stock_elements.extend(elements)
-                        except:
-                            continue
+                    # Stock info is usually in a clickable element; failing
+                    # that, any short descendant with a percentage
+                    stock_texts = [element_text(elem) for elem in STOCK_INFO_XPATH(container)]
+                    if not stock_texts:
+                        if descendant_texts is None:
+                            descendant_texts = self._descendant_texts(container)
+                        stock_texts = [
+                            text for _, text in descendant_texts
+                            if 5 < len(text) < 60 and DECIMAL_PERCENT_RE.search(text)
+                            and any(char.isalpha() for char in text)
+                        ]
                     
-                    # Also try finding by text pattern directly
-                    if not stock_elements:
-                        all_elements = container.find_elements(By.XPATH, ".//*")
-                        for elem in all_elements:
-                            try:
-                                text = elem.text or ""
-                                # Look for elements with percentage that are likely stock info
-                                if '%' in text and len(text) > 5 and len(text) < 60:
-                                    # Check if it has a stock-like pattern
-                                    if pct_pattern.search(text) and any(char.isalpha() for char in text):
-                                        stock_elements.append(elem)
-                            except:
-                                continue
-                    
-                    if stock_elements:
-                        for elem in stock_elements:
-                            stock_text = elem.text.strip()
-                            # Skip if it's too short or too long
-                            if len(stock_text) < 5 or len(stock_text) > 60:
-                                continue
-                            
-                            # Skip if it contains "ago" (it's source/time, not stock)
-                            if 'ago' in stock_text.lower():
-                                continue
-                            
-                            # Use the dedicated extraction method
-                            stock_name, stock_change = self._extract_stock_info_from_element(elem)
-                            if stock_name and stock_change:
-                                news_data['stock_name'] = stock_name
-                                news_data['stock_change'] = stock_change
-                                break
+                    # Then the container's own short lines. Source/time text
+                    # is never stock info; the first text that parses wins
+                    candidates = itertools.chain(
+                        (text for text in stock_texts if 5 <= len(text) <= 60 and not AGO_RE.search(text)),
+                        (line for line in lines if '%' in line and len(line) <= 80 and not AGO_RE.search(line)),
+                    )
+                    for text in candidates:
+                        stock_name, stock_change = parse_stock_text(text)
+                        if stock_name and stock_change:
+                            news_data['stock_name'] = stock_name
+                            news_data['stock_change'] = stock_change
+                            break
                 except Exception as e:
-                    logger.debug(f"Error finding stock elements: {e}")
-                
-                # If not found in links, search in all text lines
-                if not news_data['stock_name'] or news_data['stock_name'] == '.':
-                    for line in lines:
-                        if '%' in line and len(line) < 100:  # Stock info line is usually short
-                            # Skip if it looks like headline or source
-                            if 'ago' in line.lower() or len(line) > 80:
-                                continue
-                            
-                            # Try pattern match
-                            stock_match = stock_pattern.search(line)
-                            if stock_match:
-                                stock_name = stock_match.group(1).strip()
-                                stock_change = stock_match.group(2).strip()
-                                # Validate stock name (should be reasonable length)
-                                if len(stock_name) > 1 and len(stock_name) < 50 and stock_name != '.':
-                                    news_data['stock_name'] = stock_name
-                                    news_data['stock_change'] = stock_change
-                                    break
-                            
-                            # Fallback: extract percentage and name separately
-                            pct_match = re.search(r'([-+]?\d+\.\d+%)', line)
-                            if pct_match:
-                                news_data['stock_change'] = pct_match.group(1)
-                                # Stock name is everything before percentage
-                                name_part = line[:pct_match.start()].strip()
-                                # Clean up
-                                name_part = re.sub(r'[.,\s]+$', '', name_part)
-                                if name_part and len(name_part) > 1 and len(name_part) < 50 and name_part != '.':
-                                    news_data['stock_name'] = name_part
-                                    break
-            except Exception as e:
-                logger.debug(f"Error extracting stock info: {e}")
+                    logger.debug(f"Error extracting stock info: {e}")
             
             # Clean up stock name - remove invalid values
             if news_data['stock_name'] in ['.', '', ' ', '..']:
@@ -814,9 +1047,9 @@ class GrowwStockNewsScraper:
             # Clean up stock change - ensure it's a valid percentage
             if news_data['stock_change']:
                 # Remove invalid partial percentages like "00%", "01%" that are likely errors
-                if re.match(r'^0+%$', news_data['stock_change']) or len(news_data['stock_change']) < 4:
+                if ZERO_PERCENT_RE.match(news_data['stock_change']) or len(news_data['stock_change']) < 4:
                     # Try to find the actual percentage in the container
-                    pct_match = re.search(r'([-+]?\d+\.\d+%)', container_text)
+                    pct_match = DECIMAL_PERCENT_RE.search(container_text)
                     if pct_match:
                         news_data['stock_change'] = pct_match.group(1)
                     else:
@@ -825,35 +1058,27 @@ class GrowwStockNewsScraper:
             # Validate: must have at least headline
             if news_data['headline'] and len(news_data['headline']) > 20:
                 # Filter out invalid headlines
-                if news_data['headline'].lower() not in ['no data available for this category', 'see more', 'view more']:
+                if news_data['headline'].lower() not in INVALID_HEADLINES:
                     return news_data
             
             # Alternative validation: if we have source/time, try to get headline from container structure
             if news_data['source'] or news_data['time']:
                 # Try to find headline by looking at child elements
-                try:
-                    children = container.find_elements(By.XPATH, ".//*")
-                    for child in children:
-                        try:
-                            child_text = child.text.strip()
-                            # Skip if it's source/time or stock
-                            if 'ago' in child_text.lower() or '%' in child_text or len(child_text) < 30:
-                                continue
-                            # Skip UI elements
-                            if any(skip in child_text.lower() for skip in ['see more', 'view more', 'login', 'no data available']):
-                                continue
-                            
-                            if len(child_text) > len(news_data.get('headline', '')):
-                                news_data['headline'] = child_text
-                        except:
-                            continue
-                    
-                    if news_data['headline'] and len(news_data['headline']) > 20:
-                        # Filter out invalid headlines
-                        if news_data['headline'].lower() not in ['no data available for this category', 'see more', 'view more']:
-                            return news_data
-                except:
-                    pass
+                if descendant_texts is None:
+                    descendant_texts = self._descendant_texts(container)
+                # Skip short text, source/time, stock and UI elements
+                candidates = (
+                    child_text for _, child_text in descendant_texts
+                    if len(child_text) >= 30 and not CHILD_SKIP_RE.search(child_text)
+                )
+                best = max(candidates, key=len, default='')
+                if len(best) > len(news_data['headline']):
+                    news_data['headline'] = best
+                
+                if news_data['headline'] and len(news_data['headline']) > 20:
+                    # Filter out invalid headlines
+                    if news_data['headline'].lower() not in INVALID_HEADLINES:
+                        return news_data
             
             return None
             
@@ -870,10 +1095,11 @@ class GrowwStockNewsScraper:
             page_source = self.driver.page_source
             logger.info(f"Page source length: {len(page_source)} characters")
             
-            # Check for key terms in page source
+            # Check for key terms in page source (lowercased once, counted per term)
             key_terms = ['ago', 'CNBC', 'Business Standard', 'news', 'Stocks in news']
+            page_source_lower = page_source.lower()
             for term in key_terms:
-                count = page_source.lower().count(term.lower())
+                count = page_source_lower.count(term.lower())
                 logger.info(f"Found '{term}' {count} times in page source")
             
             # Get body text
@@ -882,8 +1108,9 @@ class GrowwStockNewsScraper:
                 logger.info(f"Body text length: {len(body_text)} characters")
                 
                 # Check for key terms in visible text
+                body_text_lower = body_text.lower()
                 for term in key_terms:
-                    count = body_text.lower().count(term.lower())
+                    count = body_text_lower.count(term.lower())
                     logger.info(f"Found '{term}' {count} times in visible text")
                 
                 # Show first 500 chars of body text
@@ -893,14 +1120,11 @@ class GrowwStockNewsScraper:
             
             # Try to find any elements with "ago"
             try:
-                ago_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'ago')]")
-                logger.info(f"Found {len(ago_elements)} elements containing 'ago'")
-                for i, elem in enumerate(ago_elements[:5], 1):
-                    try:
-                        logger.info(f"  {i}. Text: {elem.text[:100]}")
-                        logger.info(f"     Tag: {elem.tag_name}, Class: {elem.get_attribute('class')}")
-                    except:
-                        pass
+                ago_count, ago_elements = self.driver.execute_script(AGO_SAMPLE_JS, 5)
+                logger.info(f"Found {ago_count} elements containing 'ago'")
+                for i, elem in enumerate(ago_elements, 1):
+                    logger.info(f"  {i}. Text: {elem['text']}")
+                    logger.info(f"     Tag: {elem['tag']}, Class: {elem['cls']}")
             except Exception as e:
                 logger.error(f"Error finding 'ago' elements: {e}")
             
@@ -909,6 +1133,17 @@ class GrowwStockNewsScraper:
         except Exception as e:
             logger.error(f"Error in debug_page_content: {e}")
     
+    def _scrape_page(self):
+        """Extract the news items from the current page"""
+        # Snapshot the page once; both steps search the same parsed tree
+        root = self._get_dom()
+        
+        # Find news section container
+        container = self.find_news_section(root)
+        
+        # Scrape news items
+        return self.scrape_news_items(container, root)
+    
     def scrape_all_news(self):
         """
         Main method to scrape all stock news
@@ -920,14 +1155,21 @@ class GrowwStockNewsScraper:
             # Debug page content if no items found initially
             logger.info("Starting news scraping...")
             
-            # Find news section container
-            container = self.find_news_section()
-            
-            # Scrape news items
-            news_items = self.scrape_news_items(container)
-            
-            # If no items found, run debug
-            if len(news_items) == 0:
+            news_items = self._scrape_page()
+            
+            # Static HTML is only trusted, and cached, once items come out of
+            # it; otherwise render the page in the browser and try again
+            if self.static_page:
+                self.static_page = False
+                if news_items:
+                    self._write_cached_html(self.page_html)
+                else:
+                    logger.warning("No news items in static HTML, retrying in the browser")
+                    if self._load_rendered_page():
+                        news_items = self._scrape_page()
+            
+            # If no items found, run debug (needs the live page)
+            if len(news_items) == 0 and self.driver is not None:
                 logger.warning("No news items found, running debug analysis...")
                 self.debug_page_content()
             
@@ -946,19 +1188,59 @@ class GrowwStockNewsScraper:
             logger.error(traceback.format_exc())
             return None
     
-    def save_data(self, data, filename="groww_stock_news"):
+    def scrape(self, force_refresh=False):
+        """
+        Load the page and scrape it in one call
+        
+        Returns:
+            dict: scrape_all_news result, or None if the page failed to load
+        """
+        try:
+            if not self.load_page(force_refresh=force_refresh):
+                return None
+            return self.scrape_all_news()
+        finally:
+            self.cleanup()
+    
+    @classmethod
+    def scrape_many(cls, urls, workers=3, headless=True):
+        """
+        Scrape several pages concurrently
+        
+        Each worker thread drives its own browser, so page loads overlap
+        instead of running back to back. The workers' browsers are closed
+        once all pages are done, since their threads are not reused.
+        
+        Returns:
+            list: One scrape() result per URL, in the same order
+        """
+        worker_ids = set()
+        
+        def scrape(url):
+            worker_ids.add(threading.get_ident())
+            return cls(headless=headless, url=url).scrape()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape, urls))
+        finally:
+            cls.quit_shared_drivers(thread_ids=worker_ids)
+    
+    def save_data(self, data, filename="groww_stock_news", pretty=False):
         """Save data to JSON file.
 
         To avoid unbounded disk growth we now keep only a single "latest"
         snapshot by default instead of timestamped files. If you need
         historical files locally, change the filename argument when calling.
+        The snapshot is written compact; pass pretty=True to indent it.
         """
         try:
             # Default behaviour: single rolling file
             filepath = f"{filename}_latest.json"
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 as is, like ensure_ascii=False did
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None))
             
             logger.info(f"Data saved: {filepath}")
             return filepath
@@ -979,15 +1261,29 @@ class GrowwStockNewsScraper:
             return None
     
     def cleanup(self):
-        """Close browser"""
-        if self.driver:
+        """Release the browser; the shared instance stays up for the next scraper"""
+        self.driver = None
+        self.wait = None
+    
+    @classmethod
+    def quit_shared_drivers(cls, thread_ids=None):
+        """Close every shared browser, or only those of the given threads"""
+        with cls._shared_lock:
+            keys = [key for key in cls._shared_drivers
+                    if thread_ids is None or key[1] in thread_ids]
+            drivers = [cls._shared_drivers.pop(key) for key in keys]
+        
+        for driver in drivers:
             try:
-                self.driver.quit()
+                driver.quit()
                 logger.info("Browser closed")
             except:
                 pass
 
 
+atexit.register(GrowwStockNewsScraper.quit_shared_drivers)
+
+
 def main():
     """Main function"""
     print("\n" + "=" * 80)
@@ -1002,13 +1298,8 @@ def main():
     scraper = GrowwStockNewsScraper(headless=headless)
     
     try:
-        # Initialize driver
-        if not scraper._init_driver():
-            print("❌ Failed to initialize browser")
-            return
-        
-        # Navigate to page
-        if not scraper.navigate_to_page():
+        # Load page (from the local cache when fresh, else in the browser)
+        if not scraper.load_page():
             print("❌ Failed to load page")
             return
         
@@ -1040,11 +1331,12 @@ def main():
                 print(f"\n... and {len(news_data['news_items']) - 5} more items")
         else:
             print("\n⚠️  No news items found")
-            print("Taking screenshot for debugging...")
-            scraper.take_screenshot()
+            if scraper.driver:
+                print("Taking screenshot for debugging...")
+                scraper.take_screenshot()
         
         # Wait before closing
-        if not headless:
+        if not headless and scraper.driver:
             input("\nPress Enter to close browser...")
     
     except KeyboardInterrupt:
@@ -1054,7 +1346,8 @@ def main():
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
-        scraper.take_screenshot("groww_news_error")
+        if scraper.driver:
+            scraper.take_screenshot("groww_news_error")
     
     finally:
         scraper.cleanup()
@@ -0,0 +1,53 @@
+"""
+Queued Logging Setup
+====================
+
+The monitors log to a file and the console. Writing to both happens on a
+background QueueListener thread, so a logger call in the scrape loop only
+puts the record on a queue instead of waiting on disk and terminal I/O.
+
+Usage:
+    from log_config import configure_logging
+    configure_logging('crd_monitor.log')
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def configure_logging(log_file, level=logging.INFO):
+    """Configure root logging through a queue, like basicConfig does directly
+
+    As with basicConfig, this does nothing if the root logger already has
+    handlers (e.g. when start_all.py imports several monitors).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_file)
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Only merge args into the message here; the listener's handlers add
+    # the timestamp and level
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    return listener
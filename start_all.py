@@ -13,7 +13,7 @@ from event_calendar_monitor import EventCalendarMonitor
 from announcements_monitor import AnnouncementsMonitor
 from crd_monitor import CRDMonitor
 from credit_rating_monitor import CreditRatingMonitor
-from api import app
+from wsgi import serve
 import logging
 
 # Setup logging
@@ -73,9 +73,9 @@ def run_api():
         import os
         port = int(os.environ.get('PORT', 5000))
         logger.info(f"Starting Flask API on port {port}...")
-        # Wait a bit for monitors to create initial data
-        time.sleep(5)
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+        # No need to wait for the monitors: until their first snapshot lands
+        # /health reports 'initializing' and data endpoints return 404
+        serve(port)
     except Exception as e:
         logger.error(f"API error: {e}")
 
@@ -17,7 +17,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from api import app
+from wsgi import serve
 
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5000))
@@ -29,4 +29,4 @@ if __name__ == "__main__":
     logger.info("Monitors NOT running - serve existing data only")
     logger.info("=" * 80)
     
-    app.run(host='0.0.0.0', port=port, debug=False)
+    serve(port)
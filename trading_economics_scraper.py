@@ -14,7 +14,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from chromedriver_cache import get_chromedriver_path
 from selenium.webdriver.chrome.service import Service
 import json
 import time
@@ -54,8 +54,9 @@ class TradingEconomicsScraper:
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--window-size=1920,1080')
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            service = Service(get_chromedriver_path())
+            # Reuse one HTTP connection to chromedriver for every command
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             self.wait = WebDriverWait(self.driver, 20)
             
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -190,9 +191,14 @@ class TradingEconomicsScraper:
                                 event_data['importance'] = ''
                             
                             # Get country flag or icon if available
+                            # find_elements returns [] for rows without a flag instead
+                            # of raising and catching NoSuchElementException per row
                             try:
-                                flag_img = row.find_element(By.CSS_SELECTOR, "img[src*='flag'], img[alt*='flag'], [class*='flag']")
-                                event_data['country_flag'] = flag_img.get_attribute('src') or flag_img.get_attribute('alt') or ''
+                                flag_imgs = row.find_elements(By.CSS_SELECTOR, "img[src*='flag'], img[alt*='flag'], [class*='flag']")
+                                if flag_imgs:
+                                    event_data['country_flag'] = flag_imgs[0].get_attribute('src') or flag_imgs[0].get_attribute('alt') or ''
+                                else:
+                                    event_data['country_flag'] = ''
                             except:
                                 event_data['country_flag'] = ''
                             
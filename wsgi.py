@@ -0,0 +1,50 @@
+"""
+WSGI Entry Point
+================
+
+Production entry point for the NSE Data API.
+
+Usage:
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:$PORT --keep-alive 30 wsgi:app
+
+start_all.py and start_api_only.py call serve(), which launches gunicorn
+the same way and falls back to Flask's built-in server where gunicorn is
+not available (e.g. on Windows).
+"""
+
+import importlib.util
+import logging
+import os
+import subprocess
+import sys
+
+from api import app
+
+logger = logging.getLogger(__name__)
+
+
+def gunicorn_command(port):
+    """Build the gunicorn command line for the API"""
+    # The monitors' Chrome instances share the box, so stay modest by default
+    workers = int(os.environ.get('WEB_CONCURRENCY', min(4, os.cpu_count() or 1)))
+    return [
+        sys.executable, '-m', 'gunicorn',
+        '--workers', str(workers),
+        '--worker-class', 'gthread',
+        '--threads', '8',
+        '--keep-alive', '30',
+        '--bind', f'0.0.0.0:{port}',
+        '--pythonpath', os.path.dirname(os.path.abspath(__file__)),
+        'wsgi:app',
+    ]
+
+
+def serve(port):
+    """Serve the API under gunicorn, or Flask's dev server as a fallback"""
+    if importlib.util.find_spec('gunicorn') is None:
+        logger.warning("gunicorn not installed - using Flask development server")
+        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+        return
+
+    logger.info(f"Starting gunicorn on port {port}")
+    subprocess.run(gunicorn_command(port), check=False)